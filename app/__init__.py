@@ -2,11 +2,19 @@ from fastapi import APIRouter
 from app.auth.auth_backend import image_router as auth_image_router
 from app.question.api import router as question_router
 from app.question.api import router_type as question_type_router
+from app.interview.api import router as interview_router
+from app.interview.api import ranking_router as interview_ranking_router
+from app.stats.api import router as stats_router
+from app.telemetry.api import router as telemetry_router
 
 router = APIRouter()
 
 router.include_router(auth_image_router, prefix="/auth/image", tags=["auth"])
 router.include_router(question_router, prefix="/question", tags=["Question"])
 router.include_router(question_type_router, prefix="/question/type", tags=["Question Type"])
+router.include_router(interview_ranking_router, prefix="/interview/ranking", tags=["Interview Ranking"])
+router.include_router(interview_router, prefix="/interview", tags=["Interview"])
+router.include_router(stats_router, prefix="/stats", tags=["Stats"])
+router.include_router(telemetry_router, prefix="/telemetry", tags=["Telemetry"])
 
 
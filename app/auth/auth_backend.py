@@ -1,20 +1,26 @@
-from typing import List
+import datetime
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, UploadFile, File, Response
+from fastapi import APIRouter, Depends, HTTPException, Path, UploadFile, File, Response, Query
 from fastapi.security import OAuth2PasswordRequestForm
 from fastapi_users import FastAPIUsers
 from fastapi_users.authentication import BearerTransport, AuthenticationBackend
 from fastapi_users.authentication import JWTStrategy
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import noload, selectinload
 from starlette import status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, RedirectResponse
 
-from app.auth.database import User, get_async_session, UserImage
+from app.auth.database import User, get_async_session, UserImage, Role
+from app.auth.directory import search_filter, user_count_cache, adjust_user_count
 from app.auth.manager import get_user_manager
-from app.auth.schema import UserRead, UserCreate, UserUpdate, UserImageResponse
+from app.auth.schema import UserRead, UserCreate, UserUpdate, UserImageResponse, UserDirectoryPage
 from app.config import SECRET_KEY
-from app.utils.file_util import save_upload_file
+from app.interview.ranking import CANDIDATE_REMOVED, delete_candidate_scores, ranking_service
+from app.utils.file_util import save_upload_file, stored_file_url
+from app.utils.invalidation import invalidation_bus
+from app.utils.storage import storage
 
 SECRET = SECRET_KEY
 
@@ -68,6 +74,48 @@ async def get_all_users(
     return users
 
 
+@router_def.get("/users/directory", response_model=UserDirectoryPage)
+async def get_user_directory(
+        after_id: Optional[int] = Query(None, description="The next_cursor of the previous page"),
+        limit: int = Query(50, ge=1, le=200, description="The page size"),
+        role: Optional[Role] = Query(None, description="Only users with this role"),
+        is_active: Optional[bool] = Query(None, description="Only active or only inactive users"),
+        created_after: Optional[datetime.datetime] = Query(None, description="Only users created at or after"),
+        created_before: Optional[datetime.datetime] = Query(None, description="Only users created before"),
+        q: Optional[str] = Query(None, min_length=1, description="Prefix of the email or full name"),
+        include_image: bool = Query(False, description="Also load the image of every user"),
+        db: AsyncSession = Depends(get_async_session),
+        current_user: User = Depends(current_active_user)
+):
+    if not current_user.is_superuser:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+
+    query = select(User).options(selectinload(User.imageUrl) if include_image else noload(User.imageUrl))
+    if after_id is not None:
+        query = query.where(User.id > after_id)
+    if role is not None:
+        query = query.where(User.role == role)
+    if is_active is not None:
+        query = query.where(User.is_active == is_active)
+    if created_after is not None:
+        query = query.where(User.created_at >= created_after)
+    if created_before is not None:
+        query = query.where(User.created_at < created_before)
+    if q:
+        query = query.where(search_filter(q))
+
+    res = await db.execute(query.order_by(User.id).limit(limit + 1))
+    users = res.scalars().all()
+    has_more = len(users) > limit
+    users = users[:limit]
+
+    return {
+        "items": users,
+        "next_cursor": users[-1].id if has_more else None,
+        "approximate_total": await user_count_cache.count(db, role, is_active),
+    }
+
+
 @router_def.get("/user/{user_id}", response_model=UserRead)
 async def get_user(
         user_id: int = Path(..., description="The ID of the user to get"),
@@ -99,6 +147,7 @@ async def update_user(
     if not db_user:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="User not found")
 
+    old_role, old_is_active = db_user.role, db_user.is_active
     for key, value in user_update.dict(exclude_unset=True).items():
         setattr(db_user, key, value)
 
@@ -106,6 +155,10 @@ async def update_user(
     await db.commit()
     await db.refresh(db_user)
 
+    if (old_role, old_is_active) != (db_user.role, db_user.is_active):
+        adjust_user_count(old_role, old_is_active, -1)
+        adjust_user_count(db_user.role, db_user.is_active, 1)
+
     return db_user
 
 
@@ -122,8 +175,18 @@ async def delete_user(
     db_user = res.scalars().first()
     if not db_user:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="User not found")
+
+    res = await db.execute(select(UserImage).filter_by(user_id=user_id))
+    db_images = res.scalars().all()
+    for db_image in db_images:
+        await db.delete(db_image)
+    await delete_candidate_scores(db, user_id)
     await db.delete(db_user)
     await db.commit()
+    adjust_user_count(db_user.role, db_user.is_active, -1)
+    ranking_service.remove(user_id)
+    invalidation_bus.publish(CANDIDATE_REMOVED, user_id)
+    await delete_stored_images(db_images)
 
     response = JSONResponse(content={"detail": "User deleted"})
     response.delete_cookie(key="Authorization")
@@ -139,6 +202,17 @@ router.include_router(router_def, prefix="/auth", tags=["auth"])
 
 image_router = APIRouter()
 
+
+async def delete_stored_images(db_images: List[UserImage]):
+    """Best-effort removal of the files behind deleted rows; the image GC catches anything missed here."""
+    for db_image in db_images:
+        if db_image.storage_key:
+            try:
+                await storage.delete(db_image.storage_key)
+            except Exception as e:
+                print(f"Could not delete stored image {db_image.storage_key}: {e}")
+
+
 @image_router.post("/upload")
 async def upload_image(
         file: UploadFile = File(...),
@@ -148,11 +222,49 @@ async def upload_image(
     if not user:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
 
-    image_url, file_path = save_upload_file(file)
+    key = await save_upload_file(file)
 
-    db_image = UserImage(user_id=user.id, imageUrl=f"{image_url}{file_path}")
+    res = await db.execute(select(UserImage).filter_by(user_id=user.id))
+    old_images = res.scalars().all()
+    for old_image in old_images:
+        await db.delete(old_image)
+
+    db_image = UserImage(user_id=user.id, imageUrl=stored_file_url(key), storage_key=key)
     db.add(db_image)
     await db.commit()
     await db.refresh(db_image)
+    await delete_stored_images(old_images)
 
     return db_image
+
+
+@image_router.get("/file/{key}")
+async def redirect_to_stored_image(
+        key: str = Path(..., description="The storage key of the image"),
+        db: AsyncSession = Depends(get_async_session)
+):
+    # Saved image URLs point here when the storage can only hand out expiring links.
+    res = await db.execute(select(UserImage.id).filter_by(storage_key=key))
+    if not res.scalars().first():
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Image not found")
+
+    return RedirectResponse(await storage.url(key), status_code=status.HTTP_307_TEMPORARY_REDIRECT)
+
+
+@image_router.get("/url")
+async def get_image_url(
+        expires_in: int = Query(3600, ge=60, le=7 * 24 * 3600, description="Lifetime of a presigned URL"),
+        user: User = Depends(current_active_user),
+        db: AsyncSession = Depends(get_async_session)
+):
+    if not user:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+
+    res = await db.execute(select(UserImage).filter_by(user_id=user.id).order_by(UserImage.id.desc()))
+    db_image = res.scalars().first()
+    if not db_image:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Image not found")
+
+    if not db_image.storage_key:
+        return {"url": db_image.imageUrl}
+    return {"url": await storage.url(db_image.storage_key, expires_in)}
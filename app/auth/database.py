@@ -1,10 +1,11 @@
 import datetime
 import enum
+import os
 from typing import AsyncGenerator
 
 from fastapi import Depends
 from fastapi_users.db import SQLAlchemyBaseUserTable, SQLAlchemyUserDatabase
-from sqlalchemy import String, Boolean, Integer, Enum, ForeignKey, TIMESTAMP
+from sqlalchemy import String, Boolean, Integer, Enum, ForeignKey, Index, TIMESTAMP, collate, event, inspect, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
@@ -27,6 +28,7 @@ class UserImage(Base):
     id: Mapped[int] = mapped_column(Integer, unique=True, index=True, nullable=False, primary_key=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("user.id"), nullable=False)
     imageUrl: Mapped[str] = mapped_column(String, nullable=True)
+    storage_key: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=True)
 
     user: Mapped["User"] = relationship("User", back_populates="imageUrl", lazy="selectin")
 
@@ -42,27 +44,73 @@ class User(SQLAlchemyBaseUserTable[int], Base):
     fullName: Mapped[str] = mapped_column(String(length=255), nullable=False)
     email: Mapped[str] = mapped_column(String(length=320), unique=True, index=True, nullable=False)
     hashed_password: Mapped[str] = mapped_column(String(length=1024), nullable=False)
-    role: Mapped[Role] = mapped_column(Enum(Role), nullable=False)
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    role: Mapped[Role] = mapped_column(Enum(Role), index=True, nullable=False)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, index=True, nullable=False)
     is_superuser: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     is_verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
     imageUrl: Mapped["UserImage"] = relationship("UserImage", uselist=False, back_populates="user", lazy="selectin")
 
-    created_at: Mapped[datetime.datetime] = mapped_column(TIMESTAMP(timezone=True),
+    created_at: Mapped[datetime.datetime] = mapped_column(TIMESTAMP(timezone=True), index=True,
                                                           default=lambda: datetime.datetime.now(datetime.timezone.utc))
     updated_at: Mapped[datetime.datetime] = mapped_column(TIMESTAMP(timezone=True),
                                                           default=lambda: datetime.datetime.now(datetime.timezone.utc),
                                                           onupdate=lambda: datetime.datetime.now(datetime.timezone.utc))
 
 
-engine = create_async_engine(DATABASE_URL)
+# The user directory searches both case-insensitively (see directory.search_filter).
+Index("ix_user_email_nocase", collate(User.email, "NOCASE"))
+Index("ix_user_fullName_nocase", collate(User.fullName, "NOCASE"))
+
+
+engine = create_async_engine(DATABASE_URL, connect_args={"timeout": 30})
 async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
 
 
+@event.listens_for(engine.sync_engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL lets the workers started by serve.py read while another one writes.
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.close()
+
+
+def _reset_engine_after_fork():
+    # Connections opened before a fork must not be shared with the parent; start with an empty pool.
+    engine.sync_engine.dispose(close=False)
+
+
+os.register_at_fork(after_in_child=_reset_engine_after_fork)
+
+
+def add_missing_columns(sync_conn):
+    # create_all never alters existing tables; add columns and indexes introduced after a database was created.
+    columns = {column["name"] for column in inspect(sync_conn).get_columns("user_image")}
+    if "storage_key" not in columns:
+        sync_conn.execute(text("ALTER TABLE user_image ADD COLUMN storage_key VARCHAR(255)"))
+        sync_conn.execute(text(
+            "CREATE UNIQUE INDEX IF NOT EXISTS ix_user_image_storage_key ON user_image (storage_key)"
+        ))
+
+    columns = {column["name"] for column in inspect(sync_conn).get_columns("stats_score_aggregate")}
+    for name in ("score_min", "score_max"):
+        if name not in columns:
+            sync_conn.execute(text(f"ALTER TABLE stats_score_aggregate ADD COLUMN {name} FLOAT"))
+
+    for name in ("role", "is_active", "created_at"):
+        sync_conn.execute(text(f'CREATE INDEX IF NOT EXISTS "ix_user_{name}" ON "user" ("{name}")'))
+    # Replaced by the NOCASE index, which is the only one search can use.
+    sync_conn.execute(text('DROP INDEX IF EXISTS "ix_user_fullName"'))
+    for name in ("email", "fullName"):
+        sync_conn.execute(text(
+            f'CREATE INDEX IF NOT EXISTS "ix_user_{name}_nocase" ON "user" ("{name}" COLLATE NOCASE)'
+        ))
+
+
 async def create_db_and_tables():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(add_missing_columns)
 
 
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
@@ -0,0 +1,103 @@
+import string
+import sys
+import time
+from typing import Optional
+
+from sqlalchemy import and_, collate, func, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.auth.database import User, Role
+from app.utils.invalidation import invalidation_bus
+
+
+# SQLite's NOCASE collation folds ASCII letters only.
+ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def prefix_upper_bound(prefix: str, nocase: bool = False) -> Optional[str]:
+    """The smallest string greater than every string starting with ``prefix``, or None if there is none.
+
+    With ``nocase`` the bound is for comparisons under NOCASE, where ``prefix`` must already be lower case.
+    """
+    stripped = prefix.rstrip(chr(sys.maxunicode))
+    if not stripped:
+        return None
+    next_code_point = ord(stripped[-1]) + 1
+    if 0xD800 <= next_code_point <= 0xDFFF:
+        # Lone surrogates cannot be encoded for the database; skip to the first code point after them.
+        next_code_point = 0xE000
+    if nocase and next_code_point == ord("A"):
+        # Under NOCASE "A".."Z" sort as "a".."z", so the character after "@" is "[".
+        next_code_point = ord("[")
+    return stripped[:-1] + chr(next_code_point)
+
+
+def prefix_filter(column, prefix: str, nocase: bool = False):
+    """Range condition equivalent to ``column LIKE 'prefix%'`` that any B-tree index on ``column`` can serve.
+
+    With ``nocase`` the match ignores ASCII case and is served by an index declared ``COLLATE NOCASE``.
+    """
+    if nocase:
+        column = collate(column, "NOCASE")
+        prefix = prefix.translate(ASCII_LOWER)
+    upper_bound = prefix_upper_bound(prefix, nocase)
+    if upper_bound is None:
+        return column >= prefix
+    return and_(column >= prefix, column < upper_bound)
+
+
+def search_filter(q: str):
+    """Prefix match on email or full name, ignoring the case of ASCII letters."""
+    return or_(prefix_filter(User.email, q, nocase=True), prefix_filter(User.fullName, q, nocase=True))
+
+
+class UserCountCache:
+    """Per-process user counts grouped by (role, is_active).
+
+    Seeded with one grouped COUNT(*), then kept current by ``adjust_user_count`` calls from the user mutators,
+    which other workers apply too. A re-seed every ``ttl_seconds`` corrects any adjustment that was lost,
+    hence "approximate".
+    """
+
+    def __init__(self, ttl_seconds: float = 300):
+        self.ttl_seconds = ttl_seconds
+        self._counts: dict[tuple[Role, bool], int] = {}
+        self._loaded_at: Optional[float] = None
+
+    def invalidate(self):
+        self._loaded_at = None
+
+    def adjust(self, role: Role, is_active: bool, delta: int):
+        if self._loaded_at is None:
+            return
+        key = (role, is_active)
+        self._counts[key] = max(0, self._counts.get(key, 0) + delta)
+
+    async def count(self, db: AsyncSession, role: Optional[Role] = None, is_active: Optional[bool] = None) -> int:
+        if self._loaded_at is None or time.monotonic() - self._loaded_at > self.ttl_seconds:
+            res = await db.execute(select(User.role, User.is_active, func.count()).group_by(User.role, User.is_active))
+            self._counts = {(row_role, row_is_active): total for row_role, row_is_active, total in res.all()}
+            self._loaded_at = time.monotonic()
+
+        return sum(
+            total for (row_role, row_is_active), total in self._counts.items()
+            if (role is None or row_role == role) and (is_active is None or row_is_active == is_active)
+        )
+
+
+user_count_cache = UserCountCache()
+
+USER = "user"
+
+
+def adjust_user_count(role: Role, is_active: bool, delta: int):
+    """Adjust the count of this worker and send the same adjustment to the other workers."""
+    user_count_cache.adjust(role, is_active, delta)
+    invalidation_bus.publish(USER, data={"role": role.value, "is_active": is_active, "delta": delta})
+
+
+# Another worker added, removed or re-counted a user.
+invalidation_bus.subscribe(
+    USER, lambda entity_id, data: user_count_cache.adjust(Role(data["role"]), data["is_active"], data["delta"])
+)
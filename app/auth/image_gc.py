@@ -0,0 +1,77 @@
+import asyncio
+import datetime
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.auth.database import UserImage, async_session_maker
+from app.utils.file_util import stored_file_url
+from app.utils.storage import StorageBackend, storage
+
+IMAGE_GC_INTERVAL_SECONDS = 60
+IMAGE_GC_PAGE_SIZE = 1000
+# Uploads are written before their row is committed; never collect files younger than this.
+ORPHAN_GRACE_PERIOD = datetime.timedelta(hours=1)
+
+
+async def repair_image_urls(db: AsyncSession, page_size: int = IMAGE_GC_PAGE_SIZE) -> int:
+    """Rewrite saved image URLs that differ from ``stored_file_url``, e.g. presigned links that have expired."""
+    try:
+        repaired = 0
+        after_id = 0
+        while True:
+            res = await db.execute(
+                select(UserImage)
+                .where(UserImage.id > after_id, UserImage.storage_key.is_not(None))
+                .order_by(UserImage.id)
+                .limit(page_size)
+            )
+            db_images = res.scalars().all()
+            if not db_images:
+                break
+            for db_image in db_images:
+                url = stored_file_url(db_image.storage_key)
+                if db_image.imageUrl != url:
+                    db_image.imageUrl = url
+                    repaired += 1
+            await db.commit()
+            after_id = db_images[-1].id
+        return repaired
+    except Exception as e:
+        await db.rollback()
+        raise e
+
+
+async def collect_orphaned_images(db: AsyncSession, backend: StorageBackend, cursor: Optional[str],
+                                  page_size: int) -> tuple[int, Optional[str]]:
+    """Delete unreferenced files from one page of storage and return ``(deleted, next_cursor)``."""
+    objects, next_cursor = await backend.list_page(cursor, page_size)
+    if not objects:
+        return 0, next_cursor
+
+    res = await db.execute(select(UserImage.storage_key).where(UserImage.storage_key.in_([key for key, _ in objects])))
+    referenced = set(res.scalars().all())
+
+    cutoff = datetime.datetime.now(datetime.timezone.utc) - ORPHAN_GRACE_PERIOD
+    deleted = 0
+    for key, modified_at in objects:
+        if key not in referenced and modified_at < cutoff:
+            await backend.delete(key)
+            deleted += 1
+    return deleted, next_cursor
+
+
+async def run_image_gc(interval_seconds: float = IMAGE_GC_INTERVAL_SECONDS):
+    """Walk the storage one page per interval, wrapping around after the last page."""
+    cursor = None
+    while True:
+        try:
+            async with async_session_maker() as db:
+                deleted, cursor = await collect_orphaned_images(db, storage, cursor, IMAGE_GC_PAGE_SIZE)
+            if deleted:
+                print(f"Image GC deleted {deleted} orphaned files.")
+        except Exception as e:
+            print(f"Image GC failed: {e}")
+
+        await asyncio.sleep(interval_seconds)
@@ -4,6 +4,7 @@ from fastapi import Depends, Request
 from fastapi_users import BaseUserManager, IntegerIDMixin, schemas, models, exceptions
 
 from app.auth.database import User, get_user_db
+from app.auth.directory import adjust_user_count
 from app.config import SECRET_KEY
 
 SECRET = SECRET_KEY
@@ -14,6 +15,7 @@ class UserManager(IntegerIDMixin, BaseUserManager[User, int]):
     verification_token_secret = SECRET
 
     async def on_after_register(self, user: User, request: Optional[Request] = None):
+        adjust_user_count(user.role, user.is_active, 1)
         print(f"User {user.id} has registered.")
 
     async def create(
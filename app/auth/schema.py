@@ -1,5 +1,5 @@
 import datetime
-from typing import Optional
+from typing import List, Optional
 
 from fastapi_users import schemas, models
 from pydantic import BaseModel, EmailStr, ConfigDict, Field
@@ -50,6 +50,12 @@ class UserImageResponse(BaseModel):
         from_attributes = True
 
 
+class UserDirectoryPage(BaseModel):
+    items: List[UserRead] = Field(..., description="The users on this page")
+    next_cursor: Optional[int] = Field(None, description="Pass as after_id to get the next page")
+    approximate_total: int = Field(..., description="Approximate number of users matching role and is_active")
+
+
 # class UserAdminUpdate(BaseModel):
 #     email: Optional[EmailStr] = None
 #     is_active: Optional[bool] = None
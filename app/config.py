@@ -4,3 +4,12 @@ import os
 load_dotenv()
 
 SECRET_KEY = os.getenv("SECRET")
+
+# Set by serve.py for each worker it starts; worker 0 runs the singleton background jobs.
+WORKER_INDEX = int(os.getenv("WORKER_INDEX", "0"))
+
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "local")
+S3_BUCKET = os.getenv("S3_BUCKET")
+S3_ENDPOINT_URL = os.getenv("S3_ENDPOINT_URL")
+S3_REGION = os.getenv("S3_REGION")
+S3_PUBLIC_BASE_URL = os.getenv("S3_PUBLIC_BASE_URL")
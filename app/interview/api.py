@@ -0,0 +1,103 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.auth_backend import current_active_user
+from app.auth.database import get_async_session, User, Role
+from app.interview.crud import create_interview, get_interview_detail, add_interview_turn, finish_interview, \
+    get_top_candidates, get_candidate_rank
+from app.interview.ranking import OVERALL
+from app.interview.schema import InterviewCreate, InterviewTurnCreate, InterviewFinish, InterviewResponse, \
+    InterviewTurnResponse, RankedCandidateResponse, CandidateRankResponse
+
+router = APIRouter()
+
+
+@router.post("/", response_model=InterviewResponse)
+async def create_interview_endpoint(
+        interview: InterviewCreate,
+        db: AsyncSession = Depends(get_async_session),
+        user: User = Depends(current_active_user)
+):
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
+    if user.role != Role.interviewer and not user.is_superuser:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only interviewers can start interviews")
+
+    return await create_interview(db, interview, user.id)
+
+
+@router.get("/{interview_id}", response_model=InterviewResponse)
+async def get_interview_by_id_endpoint(
+        interview_id: int,
+        db: AsyncSession = Depends(get_async_session),
+        user: User = Depends(current_active_user)
+):
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
+
+    return await get_interview_detail(db, interview_id, user)
+
+
+@router.post("/{interview_id}/turns", response_model=InterviewTurnResponse)
+async def add_interview_turn_endpoint(
+        interview_id: int,
+        turn: InterviewTurnCreate,
+        db: AsyncSession = Depends(get_async_session),
+        user: User = Depends(current_active_user)
+):
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
+
+    return await add_interview_turn(db, interview_id, turn, user)
+
+
+@router.post("/{interview_id}/finish", response_model=InterviewResponse)
+async def finish_interview_endpoint(
+        interview_id: int,
+        result: InterviewFinish,
+        db: AsyncSession = Depends(get_async_session),
+        user: User = Depends(current_active_user)
+):
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
+
+    return await finish_interview(db, interview_id, result, user)
+
+
+ranking_router = APIRouter()
+
+
+def _ranking_key(type_id: Optional[int]) -> str:
+    return OVERALL if type_id is None else f"type:{type_id}"
+
+
+@ranking_router.get("/top", response_model=List[RankedCandidateResponse])
+async def get_top_candidates_endpoint(
+        type_id: Optional[int] = Query(None, description="Rank by interviews of this question type only"),
+        k: int = Query(10, ge=1, le=100, description="The number of candidates to return"),
+        offset: int = Query(0, ge=0, description="The number of top candidates to skip"),
+        db: AsyncSession = Depends(get_async_session),
+        user: User = Depends(current_active_user)
+):
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
+    if user.role != Role.interviewer and not user.is_superuser:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only interviewers can see rankings")
+
+    return await get_top_candidates(db, _ranking_key(type_id), k, offset)
+
+
+@ranking_router.get("/candidate/{candidate_id}", response_model=CandidateRankResponse)
+async def get_candidate_rank_endpoint(
+        candidate_id: int,
+        type_id: Optional[int] = Query(None, description="Rank by interviews of this question type only"),
+        user: User = Depends(current_active_user)
+):
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
+    if user.role != Role.interviewer and not user.is_superuser:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only interviewers can see rankings")
+
+    return await get_candidate_rank(_ranking_key(type_id), candidate_id)
@@ -0,0 +1,137 @@
+import json
+import mmap
+import os
+import threading
+import zlib
+from pathlib import Path
+from typing import Optional
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+ARCHIVE_DIR = BASE_DIR / "archive"
+
+BLOCK_SIZE = 64 * 1024
+
+
+def _compress(codec: str, data: bytes) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    return zlib.compress(data, 9)
+
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+class ArchiveStore:
+    """Append-only segment files holding finished interviews as compressed NDJSON blocks.
+
+    ``segment-<n>.seg`` is a sequence of independently compressed blocks. ``segment-<n>.idx`` is written
+    once the segment is durable and maps every interview id to the offset and length of its block, so a
+    read is one mmap slice plus one block decompression. Segments are never modified after being written.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._locations: dict[int, tuple[str, int, int]] = {}
+        self._codecs: dict[str, str] = {}
+        self._maps: dict[str, mmap.mmap] = {}
+
+    def _segment_names(self) -> list[str]:
+        if not self.directory.exists():
+            return []
+        return sorted(path.stem for path in self.directory.glob("segment-*.idx"))
+
+    def _load_index(self, name: str):
+        index = json.loads((self.directory / f"{name}.idx").read_text())
+        self._codecs[name] = index["codec"]
+        for interview_id, (offset, length) in index["records"].items():
+            self._locations[int(interview_id)] = (name, offset, length)
+
+    def refresh(self):
+        with self._lock:
+            for name in self._segment_names():
+                if name not in self._codecs:
+                    self._load_index(name)
+
+    def write_segment(self, records: list[dict]) -> str:
+        """Write ``records`` (each with an ``id``) as a new segment and return its name."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        codec = "zstd" if zstandard is not None else "zlib"
+
+        blocks, block, block_ids, block_size = [], [], [], 0
+        for record in records:
+            line = json.dumps(record, separators=(",", ":")).encode() + b"\n"
+            block.append(line)
+            block_ids.append(record["id"])
+            block_size += len(line)
+            if block_size >= BLOCK_SIZE:
+                blocks.append((block_ids, _compress(codec, b"".join(block))))
+                block, block_ids, block_size = [], [], 0
+        if block:
+            blocks.append((block_ids, _compress(codec, b"".join(block))))
+
+        while True:
+            names = self._segment_names() + [path.stem for path in self.directory.glob("segment-*.seg")]
+            number = max((int(name.split("-")[1]) for name in names), default=0) + 1
+            name = f"segment-{number:08d}"
+            try:
+                segment = open(self.directory / f"{name}.seg", "xb")
+                break
+            except FileExistsError:
+                continue
+
+        index = {"codec": codec, "records": {}}
+        with segment:
+            offset = 0
+            for block_ids, data in blocks:
+                segment.write(data)
+                for interview_id in block_ids:
+                    index["records"][str(interview_id)] = (offset, len(data))
+                offset += len(data)
+            segment.flush()
+            os.fsync(segment.fileno())
+
+        tmp_index = self.directory / f"{name}.idx.tmp"
+        tmp_index.write_text(json.dumps(index, separators=(",", ":")))
+        os.replace(tmp_index, self.directory / f"{name}.idx")
+        return name
+
+    def get(self, interview_id: int) -> Optional[dict]:
+        location = self._locations.get(interview_id)
+        if location is None:
+            self.refresh()
+            location = self._locations.get(interview_id)
+            if location is None:
+                return None
+
+        name, offset, length = location
+        with self._lock:
+            segment_map = self._maps.get(name)
+            if segment_map is None:
+                with open(self.directory / f"{name}.seg", "rb") as segment:
+                    segment_map = mmap.mmap(segment.fileno(), 0, access=mmap.ACCESS_READ)
+                self._maps[name] = segment_map
+
+        block = _decompress(self._codecs[name], segment_map[offset:offset + length])
+        prefix = b'{"id":%d,' % interview_id
+        for line in block.splitlines():
+            if line.startswith(prefix):
+                return json.loads(line)
+        return None
+
+    def size_on_disk(self) -> int:
+        if not self.directory.exists():
+            return 0
+        return sum(path.stat().st_size for path in self.directory.glob("segment-*"))
+
+
+archive_store = ArchiveStore(ARCHIVE_DIR)
+
@@ -0,0 +1,26 @@
+import asyncio
+
+from app.auth.database import async_session_maker
+from app.interview.archive import archive_store
+from app.interview.crud import archive_finished_interviews
+
+ARCHIVE_INTERVAL_SECONDS = 60 * 60
+ARCHIVE_AFTER_DAYS = 30
+ARCHIVE_BATCH_SIZE = 1000
+
+
+async def run_interview_archiver(interval_seconds: float = ARCHIVE_INTERVAL_SECONDS):
+    """Periodically move interviews finished more than ARCHIVE_AFTER_DAYS ago into the archive."""
+    while True:
+        try:
+            archived = 1
+            while archived:
+                async with async_session_maker() as db:
+                    archived = await archive_finished_interviews(db, archive_store, ARCHIVE_AFTER_DAYS,
+                                                                 ARCHIVE_BATCH_SIZE)
+                if archived:
+                    print(f"Interview archiver archived {archived} interviews.")
+        except Exception as e:
+            print(f"Interview archiver failed: {e}")
+
+        await asyncio.sleep(interval_seconds)
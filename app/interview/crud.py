@@ -0,0 +1,205 @@
+import asyncio
+import datetime
+
+from fastapi import HTTPException, status
+from sqlalchemy import delete, func, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.interview.archive import ArchiveStore, archive_store
+from app.auth.database import User, Role
+from app.interview.model import Interview, InterviewTurn, InterviewStatus, CandidateScore
+from app.interview.ranking import ranking_service, ranking_keys, CANDIDATE_SCORE
+from app.interview.schema import InterviewCreate, InterviewTurnCreate, InterviewFinish, InterviewResponse
+from app.question.model import QuestionType
+from app.stats.crud import record_score
+from app.utils.invalidation import invalidation_bus
+
+
+async def create_interview(db: AsyncSession, interview: InterviewCreate, interviewer_id: int):
+    try:
+        res = await db.execute(select(QuestionType.id).filter_by(id=interview.type_id))
+        if res.scalar() is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Question type not found")
+
+        res = await db.execute(select(User.role).filter_by(id=interview.candidate_id))
+        candidate_role = res.scalar()
+        if candidate_role is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Candidate not found")
+        if candidate_role != Role.candidate:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="User is not a candidate")
+
+        db_interview = Interview(**interview.model_dump(), interviewer_id=interviewer_id)
+        db.add(db_interview)
+        await db.commit()
+        await db.refresh(db_interview)
+        return db_interview
+
+    except Exception as e:
+        await db.rollback()
+        raise e
+
+
+async def get_interview_by_id(db: AsyncSession, interview_id: int):
+    try:
+        res = await db.execute(select(Interview).filter_by(id=interview_id))
+        interview = res.scalars().first()
+
+        if not interview:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Interview not found")
+
+        return interview
+    except Exception as e:
+        raise e
+
+
+async def get_interview_detail(db: AsyncSession, interview_id: int, user: User,
+                               store: ArchiveStore = archive_store):
+    try:
+        interview = await get_interview_by_id(db, interview_id)
+        if user.id not in (interview.interviewer_id, interview.candidate_id) and not user.is_superuser:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
+                                detail="Only the interviewer or candidate of this interview can read it")
+        if interview.archived_at is None:
+            return interview
+
+        record = await asyncio.to_thread(store.get, interview_id)
+        if record is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Archived interview not found")
+
+        return {**record, "archived_at": interview.archived_at}
+    except Exception as e:
+        raise e
+
+
+async def add_interview_turn(db: AsyncSession, interview_id: int, turn: InterviewTurnCreate, user: User):
+    try:
+        interview = await get_interview_by_id(db, interview_id)
+        if interview.interviewer_id != user.id and not user.is_superuser:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
+                                detail="Only the interviewer of this interview can add turns")
+        if interview.status != InterviewStatus.in_progress:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Interview is already finished")
+
+        db_turn = InterviewTurn(**turn.model_dump(), interview_id=interview_id)
+        db.add(db_turn)
+        await db.commit()
+        await db.refresh(db_turn)
+        return db_turn
+
+    except Exception as e:
+        await db.rollback()
+        raise e
+
+
+async def record_candidate_score(db: AsyncSession, interview: Interview):
+    for key in ranking_keys(interview.type_id):
+        stmt = insert(CandidateScore).values(ranking_key=key, candidate_id=interview.candidate_id,
+                                             score=interview.score, updated_at=interview.finished_at)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CandidateScore.ranking_key, CandidateScore.candidate_id],
+            set_={"score": func.max(CandidateScore.score, stmt.excluded.score), "updated_at": interview.finished_at},
+        )
+        await db.execute(stmt)
+
+
+async def finish_interview(db: AsyncSession, interview_id: int, result: InterviewFinish, user: User):
+    try:
+        interview = await get_interview_by_id(db, interview_id)
+        if interview.interviewer_id != user.id and not user.is_superuser:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
+                                detail="Only the interviewer of this interview can finish it")
+        if interview.status != InterviewStatus.in_progress:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Interview is already finished")
+
+        interview.status = InterviewStatus.finished
+        interview.score = result.score
+        interview.finished_at = datetime.datetime.now(datetime.timezone.utc)
+
+        db.add(interview)
+        await record_score(db, interview)
+        await record_candidate_score(db, interview)
+        await db.commit()
+        await db.refresh(interview)
+        ranking_service.record(interview.type_id, interview.candidate_id, interview.score)
+        invalidation_bus.publish(CANDIDATE_SCORE, interview.candidate_id,
+                                 {"type_id": interview.type_id, "score": interview.score})
+        return interview
+
+    except Exception as e:
+        await db.rollback()
+        raise e
+
+
+async def archive_finished_interviews(db: AsyncSession, store: ArchiveStore, older_than_days: int, limit: int):
+    """Move the turns of up to ``limit`` interviews finished before the cutoff into a new archive segment.
+
+    The interview row itself stays as a small header, so stats and score lookups keep working.
+    """
+    try:
+        now = datetime.datetime.now(datetime.timezone.utc)
+        res = await db.execute(
+            select(Interview)
+            .where(Interview.status == InterviewStatus.finished,
+                   Interview.archived_at.is_(None),
+                   Interview.finished_at < now - datetime.timedelta(days=older_than_days))
+            .order_by(Interview.id)
+            .limit(limit)
+        )
+        interviews = res.scalars().all()
+        if not interviews:
+            return 0
+
+        # The archive reader expects "id" to be the first key of every record.
+        records = [{"id": interview.id, **InterviewResponse.model_validate(interview).model_dump(mode="json")}
+                   for interview in interviews]
+        await asyncio.to_thread(store.write_segment, records)
+
+        interview_ids = [interview.id for interview in interviews]
+        await db.execute(delete(InterviewTurn).where(InterviewTurn.interview_id.in_(interview_ids)))
+        await db.execute(update(Interview).where(Interview.id.in_(interview_ids)).values(archived_at=now))
+        await db.commit()
+        return len(interview_ids)
+
+    except Exception as e:
+        await db.rollback()
+        raise e
+
+
+async def get_top_candidates(db: AsyncSession, ranking_key: str, k: int, offset: int):
+    try:
+        board = ranking_service.board(ranking_key)
+        entries = board.top(k, offset) if board is not None else []
+        names = {}
+        if entries:
+            res = await db.execute(
+                select(User.id, User.fullName).where(User.id.in_([candidate_id for _, candidate_id, _ in entries]))
+            )
+            names = dict(res.all())
+
+        return [
+            {"rank": rank, "candidate_id": candidate_id, "fullName": names.get(candidate_id), "score": score}
+            for rank, candidate_id, score in entries
+        ]
+    except Exception as e:
+        raise e
+
+
+async def get_candidate_rank(ranking_key: str, candidate_id: int):
+    try:
+        board = ranking_service.board(ranking_key)
+        score = board.score_of(candidate_id) if board is not None else None
+
+        if score is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Candidate has no finished interview")
+
+        return {
+            "candidate_id": candidate_id,
+            "score": score,
+            "rank": board.rank_of_score(score),
+            "percentile": round(board.percentile_of_score(score), 2),
+            "total": len(board),
+        }
+    except Exception as e:
+        raise e
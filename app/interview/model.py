@@ -0,0 +1,61 @@
+import datetime
+import enum
+from typing import Optional
+
+from sqlalchemy import Integer, String, Text, Float, Enum, TIMESTAMP, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from app.auth.database import Base
+
+
+class InterviewStatus(enum.Enum):
+    in_progress = "in_progress"
+    finished = "finished"
+
+
+class Interview(Base):
+    __tablename__ = 'interview'
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    candidate_id: Mapped[int] = mapped_column(Integer, ForeignKey("user.id"), index=True, nullable=False)
+    interviewer_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("user.id"), index=True, nullable=True)
+    type_id: Mapped[int] = mapped_column(Integer, ForeignKey("question_type.id"), index=True, nullable=False)
+    status: Mapped[InterviewStatus] = mapped_column(Enum(InterviewStatus), index=True, nullable=False,
+                                                    default=InterviewStatus.in_progress)
+    score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+
+    turns: Mapped[list["InterviewTurn"]] = relationship("InterviewTurn", back_populates="interview", lazy="selectin",
+                                                        order_by="InterviewTurn.id", cascade="all, delete-orphan")
+
+    created_at: Mapped[datetime.datetime] = mapped_column(TIMESTAMP(timezone=True),
+                                                          default=lambda: datetime.datetime.now(datetime.timezone.utc))
+    finished_at: Mapped[Optional[datetime.datetime]] = mapped_column(TIMESTAMP(timezone=True), nullable=True)
+    archived_at: Mapped[Optional[datetime.datetime]] = mapped_column(TIMESTAMP(timezone=True), nullable=True)
+
+
+class InterviewTurn(Base):
+    __tablename__ = 'interview_turn'
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    interview_id: Mapped[int] = mapped_column(Integer, ForeignKey("interview.id"), index=True, nullable=False)
+    question_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("question.id"), nullable=True)
+    question_text: Mapped[str] = mapped_column(String(255), nullable=False)
+    transcript: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+
+    interview: Mapped["Interview"] = relationship("Interview", back_populates="turns")
+
+    created_at: Mapped[datetime.datetime] = mapped_column(TIMESTAMP(timezone=True),
+                                                          default=lambda: datetime.datetime.now(datetime.timezone.utc))
+
+
+class CandidateScore(Base):
+    """Best finished-interview score per candidate and ranking key ("all" or "type:<type_id>")."""
+    __tablename__ = 'candidate_score'
+
+    ranking_key: Mapped[str] = mapped_column(String(32), primary_key=True)
+    candidate_id: Mapped[int] = mapped_column(Integer, ForeignKey("user.id"), primary_key=True)
+    score: Mapped[float] = mapped_column(Float, nullable=False)
+
+    updated_at: Mapped[datetime.datetime] = mapped_column(TIMESTAMP(timezone=True),
+                                                          default=lambda: datetime.datetime.now(datetime.timezone.utc),
+                                                          onupdate=lambda: datetime.datetime.now(datetime.timezone.utc))
@@ -0,0 +1,130 @@
+from typing import Optional
+
+from sortedcontainers import SortedList
+from sqlalchemy import delete, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.interview.model import CandidateScore, Interview, InterviewStatus
+from app.utils.invalidation import invalidation_bus
+
+OVERALL = "all"
+CANDIDATE_SCORE = "candidate_score"
+CANDIDATE_REMOVED = "candidate_removed"
+
+
+def ranking_keys(type_id: int) -> list[str]:
+    return [OVERALL, f"type:{type_id}"]
+
+
+class Leaderboard:
+    """Candidates ordered by best score, highest first; ties are broken by candidate id."""
+
+    def __init__(self, scores: Optional[dict[int, float]] = None):
+        self._scores: dict[int, float] = dict(scores or {})
+        self._order = SortedList((-score, candidate_id) for candidate_id, score in self._scores.items())
+
+    def __len__(self):
+        return len(self._order)
+
+    def record(self, candidate_id: int, score: float):
+        current = self._scores.get(candidate_id)
+        if current is not None:
+            if score <= current:
+                return
+            self._order.remove((-current, candidate_id))
+        self._scores[candidate_id] = score
+        self._order.add((-score, candidate_id))
+
+    def remove(self, candidate_id: int):
+        current = self._scores.pop(candidate_id, None)
+        if current is not None:
+            self._order.remove((-current, candidate_id))
+
+    def top(self, k: int, offset: int = 0) -> list[tuple[int, int, float]]:
+        """Return ``(rank, candidate_id, score)`` for ranks ``offset + 1`` to ``offset + k``."""
+        return [
+            (self.rank_of_score(-negative_score), candidate_id, -negative_score)
+            for negative_score, candidate_id in self._order.islice(offset, offset + k)
+        ]
+
+    def score_of(self, candidate_id: int) -> Optional[float]:
+        return self._scores.get(candidate_id)
+
+    def rank_of_score(self, score: float) -> int:
+        """1-based rank of ``score``; candidates with equal scores share a rank."""
+        return self._order.bisect_left((-score, float("-inf"))) + 1
+
+    def percentile_of_score(self, score: float) -> float:
+        """Percentage of candidates with a strictly lower score."""
+        below = len(self._order) - self._order.bisect_right((-score, float("inf")))
+        return 100.0 * below / len(self._order) if self._order else 0.0
+
+
+class RankingService:
+    """In-memory leaderboards per ranking key, rebuilt from ``candidate_score`` on startup."""
+
+    def __init__(self):
+        self._boards: dict[str, Leaderboard] = {}
+
+    def board(self, key: str) -> Optional[Leaderboard]:
+        """The leaderboard of ``key``, or None if nobody has been ranked under it."""
+        return self._boards.get(key)
+
+    def record(self, type_id: int, candidate_id: int, score: float):
+        for key in ranking_keys(type_id):
+            board = self._boards.get(key)
+            if board is None:
+                board = self._boards[key] = Leaderboard()
+            board.record(candidate_id, score)
+
+    def remove(self, candidate_id: int):
+        for board in self._boards.values():
+            board.remove(candidate_id)
+
+    async def load(self, db: AsyncSession):
+        res = await db.execute(select(func.count()).select_from(CandidateScore))
+        if not res.scalar():
+            await backfill_candidate_scores(db)
+
+        scores: dict[str, dict[int, float]] = {}
+        res = await db.execute(select(CandidateScore.ranking_key, CandidateScore.candidate_id, CandidateScore.score))
+        for key, candidate_id, score in res.all():
+            scores.setdefault(key, {})[candidate_id] = score
+        self._boards = {key: Leaderboard(board_scores) for key, board_scores in scores.items()}
+
+
+async def backfill_candidate_scores(db: AsyncSession):
+    """Fill ``candidate_score`` from finished interviews, for databases created before it existed."""
+    try:
+        finished = Interview.status == InterviewStatus.finished
+        res = await db.execute(
+            select(Interview.type_id, Interview.candidate_id, func.max(Interview.score))
+            .where(finished)
+            .group_by(Interview.type_id, Interview.candidate_id)
+        )
+        best: dict[tuple[str, int], float] = {}
+        for type_id, candidate_id, score in res.all():
+            for key in ranking_keys(type_id):
+                best[(key, candidate_id)] = max(score, best.get((key, candidate_id), score))
+
+        db.add_all([CandidateScore(ranking_key=key, candidate_id=candidate_id, score=score)
+                    for (key, candidate_id), score in best.items()])
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        raise e
+
+
+async def delete_candidate_scores(db: AsyncSession, candidate_id: int):
+    """Delete the stored best scores of a candidate; the caller commits and then calls ``remove``."""
+    await db.execute(delete(CandidateScore).where(CandidateScore.candidate_id == candidate_id))
+
+
+ranking_service = RankingService()
+
+# Scores finished on other workers are folded into this worker's leaderboards.
+invalidation_bus.subscribe(
+    CANDIDATE_SCORE, lambda candidate_id, data: ranking_service.record(data["type_id"], candidate_id, data["score"])
+)
+invalidation_bus.subscribe(CANDIDATE_REMOVED, lambda candidate_id, data: ranking_service.remove(candidate_id))
@@ -0,0 +1,61 @@
+import datetime
+
+from pydantic import BaseModel, Field
+from typing import Optional
+
+from app.interview.model import InterviewStatus
+
+
+class InterviewCreate(BaseModel):
+    candidate_id: int = Field(..., description="The ID of the candidate being interviewed")
+    type_id: int = Field(..., description="The ID of the question type the interview is about")
+
+
+class InterviewTurnCreate(BaseModel):
+    question_id: Optional[int] = Field(None, description="The ID of the question, if it came from the bank")
+    question_text: str = Field(..., description="The question that was asked")
+    transcript: Optional[str] = Field(None, description="The transcript of the candidate's answer")
+    score: Optional[float] = Field(None, ge=0, le=100, description="The score of the answer")
+
+
+class InterviewFinish(BaseModel):
+    score: float = Field(..., ge=0, le=100, description="The final score of the interview")
+
+
+class InterviewTurnResponse(InterviewTurnCreate):
+    id: int = Field(..., description="The ID of the turn")
+    interview_id: int = Field(..., description="The ID of the interview")
+    created_at: datetime.datetime = Field(..., description="The time the turn was recorded")
+
+    class Config:
+        from_attributes = True
+
+
+class InterviewResponse(InterviewCreate):
+    id: int = Field(..., description="The ID of the interview")
+    interviewer_id: Optional[int] = Field(None, description="The ID of the user who started the interview")
+    status: InterviewStatus = Field(..., description="in_progress or finished")
+    score: Optional[float] = Field(None, description="The final score of the interview")
+    turns: list[InterviewTurnResponse] = Field([], description="The turns of the interview")
+
+    created_at: datetime.datetime = Field(..., description="The time the interview was started")
+    finished_at: Optional[datetime.datetime] = Field(None, description="The time the interview was finished")
+    archived_at: Optional[datetime.datetime] = Field(None, description="The time the turns were moved to the archive")
+
+    class Config:
+        from_attributes = True
+
+
+class RankedCandidateResponse(BaseModel):
+    rank: int = Field(..., description="1-based rank; candidates with equal scores share a rank")
+    candidate_id: int = Field(..., description="The ID of the candidate")
+    fullName: Optional[str] = Field(None, description="The full name of the candidate")
+    score: float = Field(..., description="The best score of the candidate")
+
+
+class CandidateRankResponse(BaseModel):
+    candidate_id: int = Field(..., description="The ID of the candidate")
+    score: float = Field(..., description="The best score of the candidate")
+    rank: int = Field(..., description="1-based rank; candidates with equal scores share a rank")
+    percentile: float = Field(..., description="Percentage of ranked candidates with a lower score")
+    total: int = Field(..., description="The number of ranked candidates")
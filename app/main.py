@@ -8,15 +8,47 @@ from fastapi.staticfiles import StaticFiles
 from app.auth.auth_backend import router as auth_router
 from app import router
 
-from app.auth.database import create_db_and_tables
+from app.auth.database import create_db_and_tables, async_session_maker
+from app.auth.image_gc import repair_image_urls, run_image_gc
+from app.config import WORKER_INDEX
+from app.interview.archiver import run_interview_archiver
+from app.interview.ranking import ranking_service
+from app.question.crud import backfill_question_changes
+from app.stats.reconciler import run_stats_reconciler
+from app.telemetry.flusher import run_telemetry_flusher
+from app.utils.compression import CompressionMiddleware
+from app.utils.invalidation import invalidation_bus
+from app.utils.storage import storage
 
 
 @asynccontextmanager
 async def lifespan(main_app: FastAPI):
     await create_db_and_tables()
+    async with async_session_maker() as db:
+        await ranking_service.load(db)
+    invalidation_bus.start()
+
+    # Jobs that must run once per deployment only run in the first worker.
+    tasks = [asyncio.create_task(run_telemetry_flusher())]
+    if WORKER_INDEX == 0:
+        async with async_session_maker() as db:
+            await backfill_question_changes(db)
+            await repair_image_urls(db)
+        tasks += [
+            asyncio.create_task(run_stats_reconciler()),
+            asyncio.create_task(run_interview_archiver()),
+            asyncio.create_task(run_image_gc()),
+        ]
 
     yield
 
+    for task in tasks:
+        task.cancel()
+    # The telemetry flusher writes out whatever is still buffered when it is cancelled.
+    await asyncio.gather(*tasks, return_exceptions=True)
+    invalidation_bus.stop()
+    await storage.close()
+
 app = FastAPI(
     title="NomzodAI",
     version="0.1",
@@ -31,6 +63,7 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(CompressionMiddleware)
 
 
 @app.get("/")
@@ -1,19 +1,30 @@
-from typing import List
+import json
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Header
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.auth_backend import current_active_user
-from app.auth.database import get_async_session, User
+from app.auth.database import get_async_session, User, async_session_maker
+from app.question.changefeed import change_notifier
+from app.utils.compression import ResponseCache, cached_json_response
 
 from app.question.crud import create_question, get_questions, get_question_by_id, get_questions_by_type, \
     update_question, delete_question, create_question_type, get_question_types, get_question_type_by_id, \
-    update_question_type, delete_question_type
+    update_question_type, delete_question_type, get_questions_by_ids, apply_question_batch, get_changes, \
+    get_change_cursor
 from app.question.schema import QuestionCreate, QuestionResponse, QuestionUpdate, QuestionTypeResponse, \
-    QuestionTypeCreate
+    QuestionTypeCreate, QuestionBatchRequest
 
 router = APIRouter()
 
+SSE_KEEPALIVE_SECONDS = 15
+
+# Full listings keyed by the change cursor, so any question bank write invalidates them.
+listing_cache = ResponseCache()
+
 
 @router.post("/")
 async def create_question_endpoint(
@@ -29,13 +40,91 @@ async def create_question_endpoint(
 
 @router.get("/")
 async def get_questions_endpoint(
+        request: Request,
+        db: AsyncSession = Depends(get_async_session),
+        user: User = Depends(current_active_user)
+):
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
+
+    cursor = await get_change_cursor(db)
+    cached = listing_cache.get("questions", cursor)
+    if cached is None:
+        cached = listing_cache.put("questions", cursor, jsonable_encoder(await get_questions(db)))
+    return await cached_json_response(request, cached)
+
+
+@router.get("/changes")
+async def get_changes_endpoint(
+        since: int = Query(0, ge=0, description="The cursor returned by the previous call (0 for a full sync)"),
+        limit: int = Query(500, ge=1, le=1000, description="The maximum number of changes to return"),
+        db: AsyncSession = Depends(get_async_session),
+        user: User = Depends(current_active_user)
+):
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
+
+    return await get_changes(db, since, limit)
+
+
+@router.get("/changes/stream")
+async def stream_changes_endpoint(
+        request: Request,
+        since: int = Query(0, ge=0, description="The cursor to start streaming from"),
+        last_event_id: Optional[int] = Header(None, description="Sent by EventSource when reconnecting"),
+        user: User = Depends(current_active_user)
+):
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
+
+    async def event_stream():
+        cursor = last_event_id if last_event_id is not None else since
+        while not await request.is_disconnected():
+            seen_version = change_notifier.version
+            async with async_session_maker() as db:
+                page = await get_changes(db, cursor, 500)
+
+            if page["cursor"] != cursor:
+                cursor = page["cursor"]
+                data = json.dumps(jsonable_encoder(page), separators=(",", ":"))
+                yield f"id: {cursor}\nevent: changes\ndata: {data}\n\n"
+                if page["has_more"]:
+                    continue
+
+            if not await change_notifier.wait(seen_version, SSE_KEEPALIVE_SECONDS):
+                yield ": keep-alive\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+@router.get("/batch")
+async def get_questions_batch_endpoint(
+        ids: str = Query(..., description="Comma-separated question IDs, e.g. 1,2,3"),
+        db: AsyncSession = Depends(get_async_session),
+        user: User = Depends(current_active_user)
+):
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
+
+    try:
+        question_ids = [int(question_id) for question_id in ids.split(",") if question_id.strip()]
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="ids must be comma-separated integers")
+
+    return await get_questions_by_ids(db, question_ids)
+
+
+@router.post("/batch")
+async def apply_question_batch_endpoint(
+        batch: QuestionBatchRequest,
         db: AsyncSession = Depends(get_async_session),
         user: User = Depends(current_active_user)
 ):
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
 
-    return await get_questions(db)
+    return await apply_question_batch(db, batch.operations)
 
 
 @router.get("/{question_id}")
@@ -104,6 +193,7 @@ async def create_question_type_endpoint(
 
 @router_type.get("/")
 async def get_question_types_endpoint(
+        request: Request,
         db: AsyncSession = Depends(get_async_session),
         user: User = Depends(current_active_user)
 ):
@@ -111,7 +201,11 @@ async def get_question_types_endpoint(
         if not user:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
 
-        return await get_question_types(db)
+        cursor = await get_change_cursor(db)
+        cached = listing_cache.get("question_types", cursor)
+        if cached is None:
+            cached = listing_cache.put("question_types", cursor, jsonable_encoder(await get_question_types(db)))
+        return await cached_json_response(request, cached)
     except Exception as e:
         raise e
 
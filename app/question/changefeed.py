@@ -0,0 +1,39 @@
+import asyncio
+
+from app.utils.invalidation import invalidation_bus
+
+QUESTION = "question"
+QUESTION_TYPE = "question_type"
+
+UPSERT = "upsert"
+DELETE = "delete"
+
+
+class ChangeNotifier:
+    """Wakes up change-feed streams of this process after a question bank write is committed."""
+
+    def __init__(self):
+        self.version = 0
+        self._event = asyncio.Event()
+
+    def notify(self):
+        self.version += 1
+        event, self._event = self._event, asyncio.Event()
+        event.set()
+
+    async def wait(self, seen_version: int, timeout: float) -> bool:
+        """Return True once a write newer than ``seen_version`` was committed, False on timeout."""
+        if self.version != seen_version:
+            return True
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+
+change_notifier = ChangeNotifier()
+
+# Writes committed by other workers wake this worker's streams too.
+invalidation_bus.subscribe(QUESTION, lambda entity_id, data: change_notifier.notify())
+invalidation_bus.subscribe(QUESTION_TYPE, lambda entity_id, data: change_notifier.notify())
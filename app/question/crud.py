@@ -3,8 +3,21 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.exc import IntegrityError
 
-from app.question.model import Question, QuestionType
-from app.question.schema import QuestionCreate, QuestionUpdate, QuestionTypeCreate
+from sqlalchemy import func, insert, literal
+from sqlalchemy.orm import noload
+
+from app.question.changefeed import change_notifier, QUESTION, QUESTION_TYPE, UPSERT, DELETE
+from app.question.model import Question, QuestionType, QuestionChange
+from app.question.schema import QuestionCreate, QuestionUpdate, QuestionTypeCreate, QuestionBatchOperation
+from app.stats.crud import adjust_question_count, drop_question_count
+from app.utils.invalidation import invalidation_bus
+
+MAX_BATCH_SIZE = 500
+MAX_CHANGES_PAGE_SIZE = 1000
+
+
+def record_change(db: AsyncSession, entity: str, entity_id: int, op: str):
+    db.add(QuestionChange(entity=entity, entity_id=entity_id, op=op))
 
 
 async def create_question(db: AsyncSession, question: QuestionCreate):
@@ -16,7 +29,12 @@ async def create_question(db: AsyncSession, question: QuestionCreate):
         question = Question(**question.model_dump())
 
         db.add(question)
+        await db.flush()
+        record_change(db, QUESTION, question.id, UPSERT)
+        await adjust_question_count(db, question.type_id, 1)
         await db.commit()
+        change_notifier.notify()
+        invalidation_bus.publish(QUESTION, question.id)
         return question
 
     except Exception as e:
@@ -75,12 +93,19 @@ async def update_question(db: AsyncSession, question_id: int, question: Question
         if not question_type:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Question type not found")
 
+        old_type_id = db_question.type_id
         for key, value in question.model_dump(exclude_unset=True).items():
             setattr(db_question, key, value)
 
         db.add(db_question)
+        record_change(db, QUESTION, db_question.id, UPSERT)
+        if db_question.type_id != old_type_id:
+            await adjust_question_count(db, old_type_id, -1)
+            await adjust_question_count(db, db_question.type_id, 1)
         await db.commit()
         await db.refresh(db_question)
+        change_notifier.notify()
+        invalidation_bus.publish(QUESTION, db_question.id)
 
         return db_question
     except Exception as e:
@@ -97,18 +122,133 @@ async def delete_question(db: AsyncSession, question_id: int):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Question not found")
 
         await db.delete(db_question)
+        record_change(db, QUESTION, question_id, DELETE)
+        await adjust_question_count(db, db_question.type_id, -1)
         await db.commit()
+        change_notifier.notify()
+        invalidation_bus.publish(QUESTION, question_id)
         return {"status": "success", "msg": "Question deleted successfully"}
     except Exception as e:
         await db.rollback()
         raise e
 
 
+async def get_questions_by_ids(db: AsyncSession, ids: list[int]):
+    try:
+        if len(ids) > MAX_BATCH_SIZE:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                                detail=f"At most {MAX_BATCH_SIZE} ids can be requested at once")
+
+        res = await db.execute(select(Question).where(Question.id.in_(set(ids))))
+        found = {question.id: question for question in res.scalars().all()}
+
+        return {
+            "questions": [found[question_id] for question_id in ids if question_id in found],
+            "missing": [question_id for question_id in ids if question_id not in found],
+        }
+    except Exception as e:
+        raise e
+
+
+async def apply_question_batch(db: AsyncSession, operations: list[QuestionBatchOperation]):
+    try:
+        if len(operations) > MAX_BATCH_SIZE:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                                detail=f"At most {MAX_BATCH_SIZE} operations can be applied at once")
+
+        for index, operation in enumerate(operations):
+            if operation.op in ("update", "delete") and operation.id is None:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                                    detail=f"Operation {index}: id is required for {operation.op}")
+            if operation.op in ("create", "update") and operation.question is None:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                                    detail=f"Operation {index}: question is required for {operation.op}")
+            if operation.op == "create":
+                missing = [field for field in ("text", "answer", "type_id")
+                           if getattr(operation.question, field) is None]
+                if missing:
+                    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                                        detail=f"Operation {index}: {', '.join(missing)} required for create")
+
+        type_ids = {operation.question.type_id for operation in operations
+                    if operation.question is not None and operation.question.type_id is not None}
+        if type_ids:
+            res = await db.execute(select(QuestionType.id).where(QuestionType.id.in_(type_ids)))
+            unknown_type_ids = type_ids - set(res.scalars().all())
+            if unknown_type_ids:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
+                                    detail=f"Question types not found: {sorted(unknown_type_ids)}")
+
+        question_ids = {operation.id for operation in operations if operation.op != "create"}
+        existing = {}
+        if question_ids:
+            res = await db.execute(select(Question).where(Question.id.in_(question_ids)))
+            existing = {question.id: question for question in res.scalars().all()}
+            unknown_question_ids = question_ids - existing.keys()
+            if unknown_question_ids:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
+                                    detail=f"Questions not found: {sorted(unknown_question_ids)}")
+
+        results = []
+        created = []
+        # Summed per type and applied with one counter upsert per type.
+        count_deltas = {}
+        for index, operation in enumerate(operations):
+            if operation.op == "create":
+                db_question = Question(**operation.question.model_dump())
+                db.add(db_question)
+                count_deltas[db_question.type_id] = count_deltas.get(db_question.type_id, 0) + 1
+                created.append(db_question)
+                results.append(db_question)
+                continue
+
+            db_question = existing.get(operation.id)
+            if db_question is None:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                                    detail=f"Operation {index}: question {operation.id} was deleted earlier in the batch")
+
+            if operation.op == "update":
+                old_type_id = db_question.type_id
+                for key, value in operation.question.model_dump(exclude_unset=True).items():
+                    setattr(db_question, key, value)
+                record_change(db, QUESTION, operation.id, UPSERT)
+                if db_question.type_id != old_type_id:
+                    count_deltas[old_type_id] = count_deltas.get(old_type_id, 0) - 1
+                    count_deltas[db_question.type_id] = count_deltas.get(db_question.type_id, 0) + 1
+                results.append(db_question)
+            else:
+                del existing[operation.id]
+                await db.delete(db_question)
+                record_change(db, QUESTION, operation.id, DELETE)
+                count_deltas[db_question.type_id] = count_deltas.get(db_question.type_id, 0) - 1
+                results.append({"id": operation.id, "deleted": True})
+
+        # One flush inserts every created question and assigns their ids.
+        await db.flush()
+        for db_question in created:
+            record_change(db, QUESTION, db_question.id, UPSERT)
+        for type_id, delta in count_deltas.items():
+            if delta:
+                await adjust_question_count(db, type_id, delta)
+        await db.commit()
+        change_notifier.notify()
+        invalidation_bus.publish(QUESTION)
+        return {"status": "success", "results": results}
+    except Exception as e:
+        await db.rollback()
+        raise e
+
+
 async def create_question_type(db: AsyncSession, question_type: QuestionTypeCreate):
     try:
         question_type = QuestionType(**question_type.model_dump())
         db.add(question_type)
+        await db.flush()
+        record_change(db, QUESTION_TYPE, question_type.id, UPSERT)
+        await adjust_question_count(db, question_type.id, 0)
         await db.commit()
+        change_notifier.notify()
+        invalidation_bus.publish(QUESTION_TYPE, question_type.id)
         return question_type
 
     except IntegrityError:
@@ -158,8 +298,11 @@ async def update_question_type(db: AsyncSession, type_id: int, question_type: Qu
             setattr(db_question_type, key, value)
 
         db.add(db_question_type)
+        record_change(db, QUESTION_TYPE, db_question_type.id, UPSERT)
         await db.commit()
         await db.refresh(db_question_type)
+        change_notifier.notify()
+        invalidation_bus.publish(QUESTION_TYPE, db_question_type.id)
 
         return db_question_type
     except Exception as e:
@@ -176,8 +319,91 @@ async def delete_question_type(db: AsyncSession, type_id: int):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Question type not found")
 
         await db.delete(db_question_type)
+        record_change(db, QUESTION_TYPE, type_id, DELETE)
+        await drop_question_count(db, type_id)
         await db.commit()
+        change_notifier.notify()
+        invalidation_bus.publish(QUESTION_TYPE, type_id)
         return {"status": "success", "msg": "Question type deleted successfully"}
     except Exception as e:
         await db.rollback()
         raise e
+
+
+async def get_changes(db: AsyncSession, since: int, limit: int):
+    try:
+        limit = max(1, min(limit, MAX_CHANGES_PAGE_SIZE))
+        res = await db.execute(
+            select(QuestionChange).where(QuestionChange.seq > since).order_by(QuestionChange.seq).limit(limit + 1)
+        )
+        changes = res.scalars().all()
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+
+        # Only the latest change of each entity in the page matters to the client.
+        latest = {}
+        for change in changes:
+            latest[(change.entity, change.entity_id)] = change.op
+
+        upserted = {QUESTION: set(), QUESTION_TYPE: set()}
+        deleted = {QUESTION: [], QUESTION_TYPE: []}
+        for (entity, entity_id), op in latest.items():
+            if op == DELETE:
+                deleted[entity].append(entity_id)
+            else:
+                upserted[entity].add(entity_id)
+
+        questions = []
+        if upserted[QUESTION]:
+            res = await db.execute(
+                select(Question).options(noload(Question.type)).where(Question.id.in_(upserted[QUESTION]))
+            )
+            questions = [
+                {"id": q.id, "text": q.text, "answer": q.answer, "type_id": q.type_id, "updated_at": q.updated_at}
+                for q in res.scalars().all()
+            ]
+
+        question_types = []
+        if upserted[QUESTION_TYPE]:
+            res = await db.execute(
+                select(QuestionType).options(noload(QuestionType.questions))
+                .where(QuestionType.id.in_(upserted[QUESTION_TYPE]))
+            )
+            question_types = [
+                {"id": t.id, "typeName": t.typeName, "updated_at": t.updated_at} for t in res.scalars().all()
+            ]
+
+        return {
+            "cursor": changes[-1].seq if changes else since,
+            "has_more": has_more,
+            "questions": {"upserts": questions, "deletes": deleted[QUESTION]},
+            "question_types": {"upserts": question_types, "deletes": deleted[QUESTION_TYPE]},
+        }
+    except Exception as e:
+        raise e
+
+
+async def get_change_cursor(db: AsyncSession) -> int:
+    res = await db.execute(select(func.max(QuestionChange.seq)))
+    return res.scalar() or 0
+
+
+async def backfill_question_changes(db: AsyncSession):
+    """Seed ``question_change`` with an upsert per existing row, for databases created before it existed."""
+    try:
+        res = await db.execute(select(func.count()).select_from(QuestionChange))
+        if res.scalar():
+            return
+
+        columns = [QuestionChange.entity, QuestionChange.entity_id, QuestionChange.op]
+        # Types first, so a client replaying the feed never sees a question before its type.
+        await db.execute(insert(QuestionChange).from_select(
+            columns, select(literal(QUESTION_TYPE), QuestionType.id, literal(UPSERT)).order_by(QuestionType.id)
+        ))
+        await db.execute(insert(QuestionChange).from_select(
+            columns, select(literal(QUESTION), Question.id, literal(UPSERT)).order_by(Question.id)
+        ))
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        raise e
@@ -1,7 +1,7 @@
 import datetime
 
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Literal, Optional
 
 
 class QuestionBase(BaseModel):
@@ -85,3 +85,13 @@ class QuestionTypeResponse(QuestionTypeBase):
             }
         }
         arbitrary_types_allowed = True
+
+
+class QuestionBatchOperation(BaseModel):
+    op: Literal["create", "update", "delete"] = Field(..., description="The operation to apply")
+    id: Optional[int] = Field(None, description="The ID of the question (required for update and delete)")
+    question: Optional[QuestionUpdate] = Field(None, description="The question details (required for create and update)")
+
+
+class QuestionBatchRequest(BaseModel):
+    operations: list[QuestionBatchOperation] = Field(..., description="The operations to apply in one transaction")
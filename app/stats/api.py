@@ -0,0 +1,56 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.auth_backend import current_active_user
+from app.auth.database import get_async_session, User
+from app.stats.crud import get_question_type_counts, get_question_type_count, get_score_summary
+from app.stats.schema import QuestionTypeCountResponse, ScoreSummaryResponse
+from app.utils.compression import compression_stats
+
+router = APIRouter()
+
+
+@router.get("/question-types", response_model=List[QuestionTypeCountResponse])
+async def get_question_type_counts_endpoint(
+        db: AsyncSession = Depends(get_async_session),
+        user: User = Depends(current_active_user)
+):
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
+
+    return await get_question_type_counts(db)
+
+
+@router.get("/question-types/{type_id}", response_model=QuestionTypeCountResponse)
+async def get_question_type_count_endpoint(
+        type_id: int,
+        db: AsyncSession = Depends(get_async_session),
+        user: User = Depends(current_active_user)
+):
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
+
+    return await get_question_type_count(db, type_id)
+
+
+@router.get("/scores/{dimension}/{key}", response_model=ScoreSummaryResponse)
+async def get_score_summary_endpoint(
+        dimension: str,
+        key: str,
+        db: AsyncSession = Depends(get_async_session),
+        user: User = Depends(current_active_user)
+):
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
+
+    return await get_score_summary(db, dimension, key)
+
+
+@router.get("/compression")
+async def get_compression_stats_endpoint(user: User = Depends(current_active_user)):
+    if not user.is_superuser:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+
+    return compression_stats.report()
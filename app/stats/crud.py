@@ -0,0 +1,264 @@
+import datetime
+import math
+from typing import Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import Integer, String, cast, delete, func, literal_column, text
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.interview.model import Interview, InterviewStatus
+from app.question.model import Question, QuestionType
+from app.stats.model import QuestionTypeCounter, ScoreAggregate, ScoreHistogramBucket
+
+SCORE_MIN = 0.0
+SCORE_MAX = 100.0
+HISTOGRAM_BUCKETS = 20
+BUCKET_WIDTH = (SCORE_MAX - SCORE_MIN) / HISTOGRAM_BUCKETS
+
+SCORE_DIMENSIONS = ("all", "type", "interviewer", "day")
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+def score_bucket(score: float) -> int:
+    return max(0, min(int((score - SCORE_MIN) // BUCKET_WIDTH), HISTOGRAM_BUCKETS - 1))
+
+
+def score_keys(interview: Interview) -> list[tuple[str, str]]:
+    keys = [
+        ("all", "all"),
+        ("type", str(interview.type_id)),
+        ("day", interview.finished_at.date().isoformat()),
+    ]
+    if interview.interviewer_id is not None:
+        keys.append(("interviewer", str(interview.interviewer_id)))
+    return keys
+
+
+async def adjust_question_count(db: AsyncSession, type_id: int, delta: int):
+    stmt = insert(QuestionTypeCounter).values(type_id=type_id, question_count=max(delta, 0))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[QuestionTypeCounter.type_id],
+        set_={"question_count": QuestionTypeCounter.question_count + delta},
+    )
+    await db.execute(stmt)
+
+
+async def drop_question_count(db: AsyncSession, type_id: int):
+    await db.execute(delete(QuestionTypeCounter).where(QuestionTypeCounter.type_id == type_id))
+
+
+async def record_score(db: AsyncSession, interview: Interview):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    score = interview.score
+    for dimension, key in score_keys(interview):
+        stmt = insert(ScoreAggregate).values(dimension=dimension, key=key, count=1, total=score,
+                                             total_sq=score * score, score_min=score, score_max=score,
+                                             updated_at=now)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ScoreAggregate.dimension, ScoreAggregate.key],
+            set_={
+                "count": ScoreAggregate.count + 1,
+                "total": ScoreAggregate.total + score,
+                "total_sq": ScoreAggregate.total_sq + score * score,
+                "score_min": func.min(func.coalesce(ScoreAggregate.score_min, score), score),
+                "score_max": func.max(func.coalesce(ScoreAggregate.score_max, score), score),
+                "updated_at": now,
+            },
+        )
+        await db.execute(stmt)
+
+        stmt = insert(ScoreHistogramBucket).values(dimension=dimension, key=key, bucket=score_bucket(score), count=1)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ScoreHistogramBucket.dimension, ScoreHistogramBucket.key, ScoreHistogramBucket.bucket],
+            set_={"count": ScoreHistogramBucket.count + 1},
+        )
+        await db.execute(stmt)
+
+
+async def get_question_type_counts(db: AsyncSession):
+    try:
+        res = await db.execute(select(QuestionTypeCounter).order_by(QuestionTypeCounter.type_id))
+        return res.scalars().all()
+    except Exception as e:
+        raise e
+
+
+async def get_question_type_count(db: AsyncSession, type_id: int):
+    try:
+        counter = await db.get(QuestionTypeCounter, type_id)
+
+        if not counter:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Question type not found")
+
+        return counter
+    except Exception as e:
+        raise e
+
+
+def _quantiles(buckets: list[ScoreHistogramBucket], count: int, lowest: Optional[float] = None,
+               highest: Optional[float] = None) -> dict:
+    lowest = SCORE_MIN if lowest is None else lowest
+    highest = SCORE_MAX if highest is None else highest
+    result = {}
+    for q in QUANTILES:
+        rank = q * count
+        seen = 0
+        value = SCORE_MAX
+        for bucket in buckets:
+            if seen + bucket.count >= rank:
+                # Interpolate linearly inside the bucket.
+                fraction = (rank - seen) / bucket.count if bucket.count else 0.0
+                value = SCORE_MIN + (bucket.bucket + fraction) * BUCKET_WIDTH
+                break
+            seen += bucket.count
+        # Interpolation assumes scores spread across the bucket; never report beyond what was recorded.
+        result[f"p{round(q * 100)}"] = round(min(max(value, lowest), highest), 2)
+    return result
+
+
+async def get_score_summary(db: AsyncSession, dimension: str, key: str):
+    try:
+        if dimension not in SCORE_DIMENSIONS:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                                detail=f"dimension must be one of {', '.join(SCORE_DIMENSIONS)}")
+
+        aggregate = await db.get(ScoreAggregate, (dimension, key))
+        if not aggregate or not aggregate.count:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No scores recorded")
+
+        res = await db.execute(
+            select(ScoreHistogramBucket)
+            .filter_by(dimension=dimension, key=key)
+            .order_by(ScoreHistogramBucket.bucket)
+        )
+        buckets = res.scalars().all()
+
+        mean = aggregate.total / aggregate.count
+        variance = max(aggregate.total_sq / aggregate.count - mean * mean, 0.0)
+
+        return {
+            "dimension": dimension,
+            "key": key,
+            "count": aggregate.count,
+            "mean": round(mean, 2),
+            "stddev": round(math.sqrt(variance), 2),
+            "quantiles": _quantiles(buckets, aggregate.count, aggregate.score_min, aggregate.score_max),
+            "updated_at": aggregate.updated_at,
+        }
+    except Exception as e:
+        raise e
+
+
+async def reconcile_question_counts(db: AsyncSession) -> int:
+    res = await db.execute(
+        select(QuestionType.id, func.count(Question.id))
+        .outerjoin(Question, Question.type_id == QuestionType.id)
+        .group_by(QuestionType.id)
+    )
+    expected = dict(res.all())
+
+    res = await db.execute(select(QuestionTypeCounter))
+    stored = {counter.type_id: counter for counter in res.scalars().all()}
+
+    repaired = 0
+    for type_id, question_count in expected.items():
+        counter = stored.pop(type_id, None)
+        if counter is None:
+            db.add(QuestionTypeCounter(type_id=type_id, question_count=question_count))
+            repaired += 1
+        elif counter.question_count != question_count:
+            counter.question_count = question_count
+            repaired += 1
+    for counter in stored.values():
+        await db.delete(counter)
+        repaired += 1
+
+    return repaired
+
+
+def _score_key_columns():
+    return {
+        "all": literal_column("'all'"),
+        "type": cast(Interview.type_id, String),
+        "interviewer": cast(Interview.interviewer_id, String),
+        "day": func.date(Interview.finished_at),
+    }
+
+
+async def reconcile_score_aggregates(db: AsyncSession) -> int:
+    finished = Interview.status == InterviewStatus.finished
+    bucket_column = func.max(0, func.min(cast((Interview.score - SCORE_MIN) / BUCKET_WIDTH, Integer),
+                                         HISTOGRAM_BUCKETS - 1))
+
+    expected_aggregates = {}
+    expected_buckets = {}
+    for dimension, key_column in _score_key_columns().items():
+        condition = finished if dimension != "interviewer" else finished & Interview.interviewer_id.is_not(None)
+
+        res = await db.execute(
+            select(key_column, func.count(), func.sum(Interview.score), func.sum(Interview.score * Interview.score),
+                   func.min(Interview.score), func.max(Interview.score))
+            .where(condition)
+            .group_by(key_column)
+        )
+        for key, count, total, total_sq, score_min, score_max in res.all():
+            expected_aggregates[(dimension, key)] = (count, total, total_sq, score_min, score_max)
+
+        res = await db.execute(
+            select(key_column, bucket_column, func.count()).where(condition).group_by(key_column, bucket_column)
+        )
+        for key, bucket, count in res.all():
+            expected_buckets[(dimension, key, bucket)] = count
+
+    repaired = 0
+
+    res = await db.execute(select(ScoreAggregate))
+    stored_aggregates = {(row.dimension, row.key): row for row in res.scalars().all()}
+    for (dimension, key), (count, total, total_sq, score_min, score_max) in expected_aggregates.items():
+        row = stored_aggregates.pop((dimension, key), None)
+        if row is None:
+            db.add(ScoreAggregate(dimension=dimension, key=key, count=count, total=total, total_sq=total_sq,
+                                  score_min=score_min, score_max=score_max))
+            repaired += 1
+        elif (row.count != count or not math.isclose(row.total, total, abs_tol=1e-6)
+              or not math.isclose(row.total_sq, total_sq, abs_tol=1e-6)
+              or row.score_min != score_min or row.score_max != score_max):
+            row.count, row.total, row.total_sq = count, total, total_sq
+            row.score_min, row.score_max = score_min, score_max
+            repaired += 1
+    for row in stored_aggregates.values():
+        await db.delete(row)
+        repaired += 1
+
+    res = await db.execute(select(ScoreHistogramBucket))
+    stored_buckets = {(row.dimension, row.key, row.bucket): row for row in res.scalars().all()}
+    for (dimension, key, bucket), count in expected_buckets.items():
+        row = stored_buckets.pop((dimension, key, bucket), None)
+        if row is None:
+            db.add(ScoreHistogramBucket(dimension=dimension, key=key, bucket=bucket, count=count))
+            repaired += 1
+        elif row.count != count:
+            row.count = count
+            repaired += 1
+    for row in stored_buckets.values():
+        await db.delete(row)
+        repaired += 1
+
+    return repaired
+
+
+async def reconcile_stats(db: AsyncSession) -> int:
+    try:
+        # The driver only opens a transaction before the first write, so each read would otherwise see its own
+        # snapshot, and a write committed between them would be "repaired" back to a stale value. Taking the
+        # write lock up front makes every read and repair one snapshot; writers wait (up to the busy timeout).
+        await db.execute(text("BEGIN IMMEDIATE"))
+        repaired = await reconcile_question_counts(db)
+        repaired += await reconcile_score_aggregates(db)
+        await db.commit()
+        return repaired
+    except Exception as e:
+        await db.rollback()
+        raise e
@@ -0,0 +1,39 @@
+import datetime
+from typing import Optional
+
+from sqlalchemy import Integer, String, Float, TIMESTAMP, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from app.auth.database import Base
+
+
+class QuestionTypeCounter(Base):
+    __tablename__ = 'stats_question_type_counter'
+
+    type_id: Mapped[int] = mapped_column(Integer, ForeignKey("question_type.id"), primary_key=True)
+    question_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class ScoreAggregate(Base):
+    __tablename__ = 'stats_score_aggregate'
+
+    dimension: Mapped[str] = mapped_column(String(32), primary_key=True)
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    total_sq: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    score_min: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    score_max: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+
+    updated_at: Mapped[datetime.datetime] = mapped_column(TIMESTAMP(timezone=True),
+                                                          default=lambda: datetime.datetime.now(datetime.timezone.utc),
+                                                          onupdate=lambda: datetime.datetime.now(datetime.timezone.utc))
+
+
+class ScoreHistogramBucket(Base):
+    """Fixed-width score histogram per aggregate, used as the quantile sketch."""
+    __tablename__ = 'stats_score_histogram'
+
+    dimension: Mapped[str] = mapped_column(String(32), primary_key=True)
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    bucket: Mapped[int] = mapped_column(Integer, primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -0,0 +1,20 @@
+import asyncio
+
+from app.auth.database import async_session_maker
+from app.stats.crud import reconcile_stats
+
+RECONCILE_INTERVAL_SECONDS = 15 * 60
+
+
+async def run_stats_reconciler(interval_seconds: float = RECONCILE_INTERVAL_SECONDS):
+    """Periodically rebuild the counters from the source tables, repairing any drift."""
+    while True:
+        try:
+            async with async_session_maker() as db:
+                repaired = await reconcile_stats(db)
+            if repaired:
+                print(f"Stats reconciler repaired {repaired} rows.")
+        except Exception as e:
+            print(f"Stats reconciler failed: {e}")
+
+        await asyncio.sleep(interval_seconds)
@@ -0,0 +1,21 @@
+import datetime
+
+from pydantic import BaseModel, Field
+
+
+class QuestionTypeCountResponse(BaseModel):
+    type_id: int = Field(..., description="The ID of the question type")
+    question_count: int = Field(..., description="The number of questions of this type")
+
+    class Config:
+        from_attributes = True
+
+
+class ScoreSummaryResponse(BaseModel):
+    dimension: str = Field(..., description="all, type, interviewer or day")
+    key: str = Field(..., description="The type ID, interviewer ID or ISO date the scores are grouped by")
+    count: int = Field(..., description="The number of finished interviews")
+    mean: float = Field(..., description="The mean score")
+    stddev: float = Field(..., description="The standard deviation of the scores")
+    quantiles: dict[str, float] = Field(..., description="Approximate p50, p90 and p99 scores")
+    updated_at: datetime.datetime = Field(..., description="The time the last score was recorded")
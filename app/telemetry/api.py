@@ -0,0 +1,86 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect, status
+from fastapi_users.db import SQLAlchemyUserDatabase
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.auth_backend import current_active_user, get_jwt_strategy
+from app.auth.database import get_async_session, User, async_session_maker
+from app.auth.manager import UserManager
+from app.telemetry.buffer import telemetry_buffer
+from app.telemetry.crud import check_interview_accepts_telemetry, get_telemetry_summary
+from app.telemetry.schema import TelemetryBatch, TelemetryTypeSummary
+
+router = APIRouter()
+
+
+@router.post("/{interview_id}/events", status_code=status.HTTP_202_ACCEPTED)
+async def ingest_telemetry_endpoint(
+        interview_id: int,
+        batch: TelemetryBatch,
+        db: AsyncSession = Depends(get_async_session),
+        user: User = Depends(current_active_user)
+):
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
+
+    await check_interview_accepts_telemetry(db, interview_id, user)
+    telemetry_buffer.append(interview_id, batch.events)
+    return {"accepted": len(batch.events)}
+
+
+@router.websocket("/{interview_id}/ws")
+async def ingest_telemetry_websocket(
+        websocket: WebSocket,
+        interview_id: int,
+        token: str = Query(..., description="The JWT access token; browsers cannot set headers on WebSockets")
+):
+    async with async_session_maker() as db:
+        user = await get_jwt_strategy().read_token(token, UserManager(SQLAlchemyUserDatabase(db, User)))
+        if user is None or not user.is_active:
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+            return
+        try:
+            await check_interview_accepts_telemetry(db, interview_id, user)
+        except HTTPException as e:
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=e.detail)
+            return
+
+    await websocket.accept()
+    try:
+        while True:
+            message = await websocket.receive_text()
+            try:
+                batch = TelemetryBatch.model_validate_json(message)
+            except ValidationError as e:
+                await websocket.send_json({"error": e.errors(include_url=False, include_context=False)})
+                continue
+            telemetry_buffer.append(interview_id, batch.events)
+    except WebSocketDisconnect:
+        pass
+
+
+@router.get("/{interview_id}/summary", response_model=List[TelemetryTypeSummary])
+async def get_telemetry_summary_endpoint(
+        interview_id: int,
+        db: AsyncSession = Depends(get_async_session),
+        user: User = Depends(current_active_user)
+):
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
+
+    return await get_telemetry_summary(db, interview_id, user)
+
+
+@router.get("/buffer")
+async def get_telemetry_buffer_endpoint(user: User = Depends(current_active_user)):
+    if not user.is_superuser:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+
+    return {
+        "pending": len(telemetry_buffer),
+        "capacity": telemetry_buffer.capacity,
+        "flushed": telemetry_buffer.flushed,
+        "dropped": telemetry_buffer.dropped,
+    }
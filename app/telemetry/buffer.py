@@ -0,0 +1,117 @@
+import asyncio
+from collections import deque
+from typing import Awaitable, Callable, Optional
+
+from sqlalchemy.exc import DataError, IntegrityError
+
+from app.telemetry.schema import TelemetryEventIn
+
+BUFFER_CAPACITY = 100_000
+FLUSH_SIZE = 2_000
+FLUSH_INTERVAL_SECONDS = 1.0
+MAX_RETRY_DELAY_SECONDS = 30.0
+
+# Errors caused by the rows themselves; anything else (e.g. "database is locked") is retried later.
+ROW_ERRORS = (DataError, IntegrityError)
+
+# (interview_id, type, ts, value)
+EventRow = tuple[int, int, int, Optional[float]]
+
+
+class TelemetryBuffer:
+    """Bounded per-process ring of pending telemetry events.
+
+    Producers and the flusher all run on the event loop, and ``deque`` appends and pops are atomic, so no
+    lock is needed. When the ring is full the oldest events are dropped to make room for new ones.
+    """
+
+    def __init__(self, capacity: int = BUFFER_CAPACITY, flush_size: int = FLUSH_SIZE,
+                 flush_interval: float = FLUSH_INTERVAL_SECONDS):
+        self.capacity = capacity
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self.flushed = 0
+        self._ring: deque[EventRow] = deque(maxlen=capacity)
+        self._wakeup = asyncio.Event()
+
+    def __len__(self):
+        return len(self._ring)
+
+    def append(self, interview_id: int, events: list[TelemetryEventIn]):
+        overflow = len(self._ring) + len(events) - self.capacity
+        if overflow > 0:
+            self.dropped += overflow
+        self._ring.extend((interview_id, int(event.t), event.ts, event.v) for event in events)
+        if len(self._ring) >= self.flush_size:
+            self._wakeup.set()
+
+    def drain(self, max_items: int) -> list[EventRow]:
+        ring = self._ring
+        return [ring.popleft() for _ in range(min(max_items, len(ring)))]
+
+    def requeue(self, rows: list[EventRow]):
+        """Put drained rows back in front of the ring; if it filled up meanwhile the oldest are dropped."""
+        overflow = len(self._ring) + len(rows) - self.capacity
+        if overflow > 0:
+            self.dropped += overflow
+            rows = rows[overflow:]
+        self._ring.extendleft(reversed(rows))
+
+    async def run(self, flush: Callable[[list[EventRow]], Awaitable[None]]):
+        """Flush whenever ``flush_size`` events are pending or ``flush_interval`` has passed.
+
+        While the database is unavailable the pending events stay in the ring and flushing backs off.
+        """
+        failures = 0
+        try:
+            while True:
+                if failures:
+                    await asyncio.sleep(min(self.flush_interval * 2 ** failures, MAX_RETRY_DELAY_SECONDS))
+                else:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+                    except asyncio.TimeoutError:
+                        pass
+                self._wakeup.clear()
+                failures = 0 if await self._flush_pending(flush) else failures + 1
+        except asyncio.CancelledError:
+            await self._flush_pending(flush)
+            raise
+
+    async def _flush_pending(self, flush: Callable[[list[EventRow]], Awaitable[None]]) -> bool:
+        """Flush everything pending; return False if the database failed and the rest was put back."""
+        while self._ring:
+            unflushed = await self._flush_rows(flush, self.drain(self.flush_size))
+            if unflushed:
+                self.requeue(unflushed)
+                return False
+        return True
+
+    async def _flush_rows(self, flush: Callable[[list[EventRow]], Awaitable[None]],
+                          rows: list[EventRow]) -> list[EventRow]:
+        """Flush ``rows`` and return those left unflushed because the database failed.
+
+        When the database rejects the rows themselves each half is retried, so only the rows that cannot be
+        stored are dropped.
+        """
+        try:
+            await flush(rows)
+        except ROW_ERRORS as e:
+            if len(rows) == 1:
+                self.dropped += 1
+                print(f"Telemetry event {rows[0]} could not be stored: {e}")
+                return []
+            middle = len(rows) // 2
+            unflushed = await self._flush_rows(flush, rows[:middle])
+            if unflushed:
+                return unflushed + rows[middle:]
+            return await self._flush_rows(flush, rows[middle:])
+        except Exception as e:
+            print(f"Telemetry flush failed, keeping {len(rows)} events pending: {e}")
+            return rows
+        self.flushed += len(rows)
+        return []
+
+
+telemetry_buffer = TelemetryBuffer()
@@ -0,0 +1,109 @@
+from fastapi import HTTPException, status
+from sqlalchemy import func, insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.auth.database import User
+from app.interview.model import Interview, InterviewStatus
+from app.telemetry.buffer import EventRow
+from app.telemetry.model import TelemetryEvent, TelemetryAggregate
+
+
+async def check_interview_accepts_telemetry(db: AsyncSession, interview_id: int, user: User):
+    try:
+        res = await db.execute(select(Interview.status, Interview.candidate_id).filter_by(id=interview_id))
+        interview = res.first()
+
+        if interview is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Interview not found")
+        if interview.candidate_id != user.id:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
+                                detail="Only the candidate of this interview can send its telemetry")
+        if interview.status != InterviewStatus.in_progress:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Interview is already finished")
+    except Exception as e:
+        raise e
+
+
+def _aggregate(rows: list[EventRow]) -> dict[tuple[int, int], dict]:
+    groups = {}
+    for interview_id, event_type, ts, value in rows:
+        group = groups.get((interview_id, event_type))
+        if group is None:
+            group = groups[(interview_id, event_type)] = {
+                "interview_id": interview_id, "type": event_type, "count": 0, "value_count": 0,
+                "value_total": 0.0, "value_min": None, "value_max": None, "first_ts": ts, "last_ts": ts,
+            }
+        group["count"] += 1
+        group["first_ts"] = min(group["first_ts"], ts)
+        group["last_ts"] = max(group["last_ts"], ts)
+        if value is not None:
+            group["value_count"] += 1
+            group["value_total"] += value
+            group["value_min"] = value if group["value_min"] is None else min(group["value_min"], value)
+            group["value_max"] = value if group["value_max"] is None else max(group["value_max"], value)
+    return groups
+
+
+async def flush_telemetry(db: AsyncSession, rows: list[EventRow]):
+    """Bulk insert buffered events and fold them into the per-interview aggregates in one transaction."""
+    try:
+        await db.execute(
+            insert(TelemetryEvent),
+            [{"interview_id": interview_id, "type": event_type, "ts": ts, "value": value}
+             for interview_id, event_type, ts, value in rows],
+        )
+
+        for group in _aggregate(rows).values():
+            stmt = sqlite_insert(TelemetryAggregate).values(**group)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[TelemetryAggregate.interview_id, TelemetryAggregate.type],
+                set_={
+                    "count": TelemetryAggregate.count + stmt.excluded.count,
+                    "value_count": TelemetryAggregate.value_count + stmt.excluded.value_count,
+                    "value_total": TelemetryAggregate.value_total + stmt.excluded.value_total,
+                    # SQLite's two-argument min/max return NULL if either side is NULL, hence the coalesce.
+                    "value_min": func.min(func.coalesce(TelemetryAggregate.value_min, stmt.excluded.value_min),
+                                          func.coalesce(stmt.excluded.value_min, TelemetryAggregate.value_min)),
+                    "value_max": func.max(func.coalesce(TelemetryAggregate.value_max, stmt.excluded.value_max),
+                                          func.coalesce(stmt.excluded.value_max, TelemetryAggregate.value_max)),
+                    "first_ts": func.min(TelemetryAggregate.first_ts, stmt.excluded.first_ts),
+                    "last_ts": func.max(TelemetryAggregate.last_ts, stmt.excluded.last_ts),
+                },
+            )
+            await db.execute(stmt)
+
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        raise e
+
+
+async def get_telemetry_summary(db: AsyncSession, interview_id: int, user: User):
+    try:
+        res = await db.execute(select(Interview.interviewer_id).filter_by(id=interview_id))
+        interview = res.first()
+        if interview is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Interview not found")
+        if interview.interviewer_id != user.id and not user.is_superuser:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
+                                detail="Only the interviewer of this interview can read its telemetry")
+
+        res = await db.execute(
+            select(TelemetryAggregate).filter_by(interview_id=interview_id).order_by(TelemetryAggregate.type)
+        )
+        return [
+            {
+                "type": aggregate.type,
+                "count": aggregate.count,
+                "value_mean": aggregate.value_total / aggregate.value_count if aggregate.value_count else None,
+                "value_min": aggregate.value_min,
+                "value_max": aggregate.value_max,
+                "first_ts": aggregate.first_ts,
+                "last_ts": aggregate.last_ts,
+            }
+            for aggregate in res.scalars().all()
+        ]
+    except Exception as e:
+        raise e
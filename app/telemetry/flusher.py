@@ -0,0 +1,12 @@
+from app.auth.database import async_session_maker
+from app.telemetry.buffer import EventRow, telemetry_buffer
+from app.telemetry.crud import flush_telemetry
+
+
+async def _flush(rows: list[EventRow]):
+    async with async_session_maker() as db:
+        await flush_telemetry(db, rows)
+
+
+async def run_telemetry_flusher():
+    await telemetry_buffer.run(_flush)
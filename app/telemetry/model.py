@@ -0,0 +1,31 @@
+from typing import Optional
+
+from sqlalchemy import Integer, Float, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from app.auth.database import Base
+
+
+class TelemetryEvent(Base):
+    __tablename__ = 'telemetry_event'
+    __table_args__ = (Index("ix_telemetry_event_interview_type", "interview_id", "type"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    interview_id: Mapped[int] = mapped_column(Integer, ForeignKey("interview.id"), nullable=False)
+    type: Mapped[int] = mapped_column(Integer, nullable=False)
+    ts: Mapped[int] = mapped_column(Integer, nullable=False)
+    value: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+
+
+class TelemetryAggregate(Base):
+    """Per interview and event type totals, updated in the same transaction as each flush."""
+    __tablename__ = 'telemetry_aggregate'
+
+    interview_id: Mapped[int] = mapped_column(Integer, ForeignKey("interview.id"), primary_key=True)
+    type: Mapped[int] = mapped_column(Integer, primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    value_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    value_total: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    value_min: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    value_max: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    first_ts: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_ts: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -0,0 +1,41 @@
+import enum
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+MAX_EVENTS_PER_BATCH = 1000
+MAX_TS = 2 ** 53
+# Keeps the per-interview sums in telemetry_aggregate finite.
+MAX_VALUE = 1e12
+
+
+class TelemetryEventType(enum.IntEnum):
+    focus = 1
+    blur = 2
+    paste = 3
+    keystroke = 4
+    answer_latency = 5
+
+
+class TelemetryEventIn(BaseModel):
+    """A single client event. Keys are kept short because clients send tens of them per second."""
+    model_config = ConfigDict(extra="forbid", allow_inf_nan=False)
+
+    t: TelemetryEventType = Field(..., description="1 focus, 2 blur, 3 paste, 4 keystroke, 5 answer latency")
+    ts: int = Field(..., ge=0, le=MAX_TS, description="Milliseconds since the interview started")
+    v: Optional[float] = Field(None, ge=0, le=MAX_VALUE, allow_inf_nan=False,
+                               description="Paste length, inter-key interval or answer latency in ms")
+
+
+class TelemetryBatch(BaseModel):
+    events: list[TelemetryEventIn] = Field(..., max_length=MAX_EVENTS_PER_BATCH, description="The events to ingest")
+
+
+class TelemetryTypeSummary(BaseModel):
+    type: TelemetryEventType = Field(..., description="The event type")
+    count: int = Field(..., description="The number of events")
+    value_mean: Optional[float] = Field(None, description="The mean value of the events that carried one")
+    value_min: Optional[float] = Field(None, description="The smallest value")
+    value_max: Optional[float] = Field(None, description="The largest value")
+    first_ts: int = Field(..., description="The timestamp of the first event")
+    last_ts: int = Field(..., description="The timestamp of the last event")
@@ -0,0 +1,266 @@
+import json
+import threading
+import time
+import zlib
+from typing import Optional
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+MINIMUM_SIZE = 1024
+OFFLOAD_SIZE = 64 * 1024
+
+AVAILABLE_ENCODINGS = tuple(
+    encoding for encoding, available in (("zstd", zstandard is not None), ("br", brotli is not None), ("gzip", True))
+    if available
+)
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "application/xml")
+
+
+class CompressionStats:
+    """Bytes in/out and CPU time spent per content encoding, reported by ``/stats/compression``."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals: dict[str, dict[str, float]] = {}
+
+    def record(self, encoding: str, bytes_in: int, bytes_out: int, cpu_seconds: float, responses: int = 0,
+               cache_hits: int = 0):
+        with self._lock:
+            totals = self._totals.setdefault(
+                encoding, {"responses": 0, "cache_hits": 0, "bytes_in": 0, "bytes_out": 0, "cpu_seconds": 0.0}
+            )
+            totals["responses"] += responses
+            totals["cache_hits"] += cache_hits
+            totals["bytes_in"] += bytes_in
+            totals["bytes_out"] += bytes_out
+            totals["cpu_seconds"] += cpu_seconds
+
+    def report(self) -> dict:
+        with self._lock:
+            report = {}
+            for encoding, totals in self._totals.items():
+                responses = totals["responses"] or 1
+                report[encoding] = {
+                    "responses": totals["responses"],
+                    "cache_hits": totals["cache_hits"],
+                    "bytes_in": totals["bytes_in"],
+                    "bytes_out": totals["bytes_out"],
+                    "bytes_saved": totals["bytes_in"] - totals["bytes_out"],
+                    "ratio": round(totals["bytes_out"] / totals["bytes_in"], 4) if totals["bytes_in"] else None,
+                    "cpu_ms_per_response": round(totals["cpu_seconds"] * 1000 / responses, 3),
+                }
+            return report
+
+
+compression_stats = CompressionStats()
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick the best available encoding allowed by an Accept-Encoding header, or None for identity."""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    candidates = [encoding for encoding in AVAILABLE_ENCODINGS if accepted.get(encoding, wildcard) > 0]
+    if not candidates:
+        return None
+    # Highest quality wins; ties go to the better compressor, i.e. the order of AVAILABLE_ENCODINGS.
+    return max(candidates, key=lambda encoding: (accepted.get(encoding, wildcard), -AVAILABLE_ENCODINGS.index(encoding)))
+
+
+class StreamCompressor:
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "zstd":
+            self._compressor = zstandard.ZstdCompressor(level=3).compressobj()
+        elif encoding == "br":
+            self._compressor = brotli.Compressor(quality=5)
+        else:
+            self._compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress ``data`` and flush it, so every chunk reaches the client without waiting for the next."""
+        if self.encoding == "zstd":
+            return self._compressor.compress(data) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        if self.encoding == "br":
+            return self._compressor.process(data) + self._compressor.flush()
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+
+def compress(encoding: str, data: bytes) -> bytes:
+    """One-shot compression of a complete body, at a higher level than streaming since it happens once."""
+    start = time.thread_time()
+    if encoding == "zstd":
+        compressed = zstandard.ZstdCompressor(level=9).compress(data)
+    elif encoding == "br":
+        compressed = brotli.compress(data, quality=9)
+    else:
+        compressor = zlib.compressobj(9, zlib.DEFLATED, 31)
+        compressed = compressor.compress(data) + compressor.flush()
+    compression_stats.record(encoding, len(data), len(compressed), time.thread_time() - start)
+    return compressed
+
+
+async def compress_body(encoding: str, data: bytes) -> bytes:
+    if len(data) >= OFFLOAD_SIZE:
+        return await anyio.to_thread.run_sync(compress, encoding, data)
+    return compress(encoding, data)
+
+
+def _is_compressible(headers: Headers) -> bool:
+    content_type = headers.get("content-type", "")
+    return (
+        "content-encoding" not in headers
+        and content_type.startswith(COMPRESSIBLE_TYPES)
+        and not content_type.startswith("text/event-stream")
+    )
+
+
+class CompressionMiddleware:
+    """Negotiated response compression.
+
+    Complete bodies below ``minimum_size`` are sent as is, and bodies of OFFLOAD_SIZE or more are compressed
+    in a worker thread. Streamed bodies are compressed chunk by chunk. Responses that already carry a
+    Content-Encoding, such as those from ``cached_json_response``, are left alone.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = MINIMUM_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        compressor: Optional[StreamCompressor] = None
+        passthrough = False
+
+        async def send_compressed(message: Message):
+            nonlocal start_message, compressor, passthrough
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                passthrough = not _is_compressible(Headers(raw=message["headers"]))
+                if passthrough:
+                    await send(message)
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            headers = MutableHeaders(raw=start_message["headers"])
+
+            if compressor is None and not more_body:
+                if len(body) < self.minimum_size:
+                    await send(start_message)
+                    await send(message)
+                    return
+                compressed = await compress_body(encoding, body)
+                compression_stats.record(encoding, 0, 0, 0.0, responses=1)
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(compressed))
+                headers.add_vary_header("Accept-Encoding")
+                await send(start_message)
+                await send({"type": "http.response.body", "body": compressed})
+                return
+
+            if compressor is None:
+                compressor = StreamCompressor(encoding)
+                compression_stats.record(encoding, 0, 0, 0.0, responses=1)
+                headers["Content-Encoding"] = encoding
+                del headers["Content-Length"]
+                headers.add_vary_header("Accept-Encoding")
+                await send(start_message)
+
+            started = time.thread_time()
+            chunk = compressor.compress(body) if more_body else compressor.compress(body) + compressor.finish()
+            compression_stats.record(encoding, len(body), len(chunk), time.thread_time() - started)
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
+
+
+class CachedBody:
+    """A serialized response body together with its compressed representations, built at most once each."""
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.variants: dict[str, bytes] = {}
+
+    async def variant(self, encoding: str) -> bytes:
+        compressed = self.variants.get(encoding)
+        if compressed is None:
+            compressed = await compress_body(encoding, self.body)
+            self.variants[encoding] = compressed
+        else:
+            compression_stats.record(encoding, len(self.body), len(compressed), 0.0, cache_hits=1)
+        return compressed
+
+
+class ResponseCache:
+    """Serialized JSON bodies keyed by name, valid for one data version (e.g. the question change cursor)."""
+
+    def __init__(self):
+        self._entries: dict[str, tuple[int, CachedBody]] = {}
+
+    def get(self, key: str, version: int) -> Optional[CachedBody]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != version:
+            return None
+        return entry[1]
+
+    def put(self, key: str, version: int, content) -> CachedBody:
+        body = CachedBody(json.dumps(content, separators=(",", ":")).encode())
+        self._entries[key] = (version, body)
+        return body
+
+    def clear(self):
+        self._entries.clear()
+
+
+async def cached_json_response(request: Request, cached: CachedBody, minimum_size: int = MINIMUM_SIZE) -> Response:
+    encoding = negotiate_encoding(request.headers.get("accept-encoding", ""))
+    if encoding is None or len(cached.body) < minimum_size:
+        return Response(cached.body, media_type="application/json")
+
+    compression_stats.record(encoding, 0, 0, 0.0, responses=1)
+    return Response(await cached.variant(encoding), media_type="application/json",
+                    headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"})
@@ -1,16 +1,31 @@
-from fastapi import UploadFile
+import uuid
 from pathlib import Path
 
-BASE_DIR = Path(__file__).resolve().parent.parent
-IMAGE_DIR = BASE_DIR / "storage"
+from fastapi import UploadFile
+
+from app.utils.storage import IMAGE_DIR, storage
+
+# Served by ``auth_backend.redirect_to_stored_image``.
+STORED_FILE_ROUTE = "/auth/image/file"
+
+# Several workers may import this at the same time.
+IMAGE_DIR.mkdir(exist_ok=True)
+
+
+def new_storage_key(filename: str) -> str:
+    """A collision-free storage key that keeps the extension of the uploaded file."""
+    suffix = Path(filename or "").suffix.lower()
+    if not suffix[1:].isalnum() or len(suffix) > 10:
+        suffix = ""
+    return f"{uuid.uuid4().hex}{suffix}"
+
 
-if not IMAGE_DIR.exists():
-    IMAGE_DIR.mkdir()
+def stored_file_url(key: str) -> str:
+    """The URL saved with an upload. Backends that only presign get a stable app route that redirects."""
+    return storage.permanent_url(key) or f"{STORED_FILE_ROUTE}/{key}"
 
 
-def save_upload_file(upload_file: UploadFile) -> tuple:
-    main_image_url = f"/storage/"
-    file_location = IMAGE_DIR / upload_file.filename
-    with open(file_location, "wb") as buffer:
-        buffer.write(upload_file.file.read())
-    return main_image_url, upload_file.filename
+async def save_upload_file(upload_file: UploadFile) -> str:
+    key = new_storage_key(upload_file.filename)
+    await storage.save(key, await upload_file.read())
+    return key
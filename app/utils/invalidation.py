@@ -0,0 +1,80 @@
+import asyncio
+import json
+import os
+import socket
+from typing import Any, Callable, Optional
+
+MAX_MESSAGE_SIZE = 64 * 1024
+READY = "__ready__"
+
+Subscriber = Callable[[Optional[int], Optional[dict]], Any]
+
+
+class InvalidationBus:
+    """Broadcasts entity changes to the other workers started by ``serve.py``.
+
+    Each worker holds one end of a Unix datagram socketpair whose other end is held by the serve process,
+    which relays every message to all other workers. Mutators update their own process's state directly
+    and call ``publish``; subscribers only run for messages that come from other workers. Without
+    ``serve.py`` (plain uvicorn, one process) no socket is attached and ``publish`` does nothing.
+    """
+
+    def __init__(self):
+        self._socket: Optional[socket.socket] = None
+        self._subscribers: dict[str, list[Subscriber]] = {}
+        self.versions: dict[str, int] = {}
+
+    def attach(self, sock: socket.socket):
+        sock.setblocking(False)
+        self._socket = sock
+
+    def subscribe(self, entity: str, callback: Subscriber):
+        self._subscribers.setdefault(entity, []).append(callback)
+
+    def publish(self, entity: str, entity_id: Optional[int] = None, data: Optional[dict] = None):
+        self.versions[entity] = self.versions.get(entity, 0) + 1
+        if self._socket is None:
+            return
+        message = json.dumps({"e": entity, "i": entity_id, "d": data, "p": os.getpid()}, separators=(",", ":"))
+        try:
+            self._socket.send(message.encode())
+        except (BlockingIOError, OSError) as e:
+            # The serve process is gone or backed up; other workers fall back to their cache TTLs.
+            print(f"Invalidation bus dropped {entity} message: {e}")
+
+    def _on_readable(self):
+        while True:
+            try:
+                payload = self._socket.recv(MAX_MESSAGE_SIZE)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                self.stop()
+                return
+            if not payload:
+                return
+
+            message = json.loads(payload)
+            entity = message["e"]
+            self.versions[entity] = self.versions.get(entity, 0) + 1
+            for callback in self._subscribers.get(entity, []):
+                try:
+                    callback(message["i"], message["d"])
+                except Exception as e:
+                    print(f"Invalidation subscriber for {entity} failed: {e}")
+
+    def start(self):
+        if self._socket is not None:
+            asyncio.get_running_loop().add_reader(self._socket.fileno(), self._on_readable)
+            # Tells the serve process this worker is up, e.g. so a reload can stop the worker it replaces.
+            self.publish(READY)
+
+    def stop(self):
+        if self._socket is not None:
+            try:
+                asyncio.get_running_loop().remove_reader(self._socket.fileno())
+            except RuntimeError:
+                pass
+
+
+invalidation_bus = InvalidationBus()
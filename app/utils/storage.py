@@ -0,0 +1,197 @@
+import abc
+import contextlib
+import datetime
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional
+
+import anyio
+
+from app.config import STORAGE_BACKEND, S3_BUCKET, S3_ENDPOINT_URL, S3_REGION, S3_PUBLIC_BASE_URL
+
+try:
+    from aiobotocore.session import get_session
+except ImportError:
+    get_session = None
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+IMAGE_DIR = BASE_DIR / "storage"
+
+# (key, last modified)
+StoredObject = tuple[str, datetime.datetime]
+
+
+class StorageBackend(abc.ABC):
+    """Where uploaded files live. Keys are opaque names produced by ``file_util.new_storage_key``."""
+
+    @abc.abstractmethod
+    async def save(self, key: str, data: bytes): ...
+
+    @abc.abstractmethod
+    async def read(self, key: str) -> bytes: ...
+
+    @abc.abstractmethod
+    async def delete(self, key: str): ...
+
+    @abc.abstractmethod
+    async def url(self, key: str, expires_in: int = 3600) -> str:
+        """A URL the client can fetch the file from directly."""
+
+    def permanent_url(self, key: str) -> Optional[str]:
+        """A URL for the file that never expires, or None if the backend can only hand out expiring ones."""
+        return None
+
+    @abc.abstractmethod
+    async def list_page(self, cursor: Optional[str], limit: int) -> tuple[list[StoredObject], Optional[str]]:
+        """Return roughly ``limit`` stored objects after ``cursor`` and the cursor to continue from.
+
+        The returned cursor is None once everything has been listed, so callers can walk the whole store a
+        page at a time without ever holding the full listing.
+        """
+
+    async def close(self):
+        pass
+
+
+class LocalStorage(StorageBackend):
+    """Files under ``root`` sharded as ``ab/cd/<key>`` by the sha256 of the key.
+
+    Two levels of 256 directories keep every directory small even with many millions of files.
+    """
+
+    def __init__(self, root: Path, url_prefix: str = "/storage/"):
+        self.root = root
+        self.url_prefix = url_prefix
+
+    @staticmethod
+    def shard(key: str) -> str:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return f"{digest[:2]}/{digest[2:4]}"
+
+    def path(self, key: str) -> Path:
+        return self.root / self.shard(key) / key
+
+    async def save(self, key: str, data: bytes):
+        def write():
+            path = self.path(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f".{key}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+
+        await anyio.to_thread.run_sync(write)
+
+    async def read(self, key: str) -> bytes:
+        return await anyio.to_thread.run_sync(self.path(key).read_bytes)
+
+    async def delete(self, key: str):
+        await anyio.to_thread.run_sync(lambda: self.path(key).unlink(missing_ok=True))
+
+    def permanent_url(self, key: str) -> Optional[str]:
+        return f"{self.url_prefix}{self.shard(key)}/{key}"
+
+    async def url(self, key: str, expires_in: int = 3600) -> str:
+        return self.permanent_url(key)
+
+    def _list_page(self, cursor: Optional[str], limit: int) -> tuple[list[StoredObject], Optional[str]]:
+        objects: list[StoredObject] = []
+        last_shard = None
+        if not self.root.exists():
+            return objects, None
+
+        # Whole shard directories are listed at a time; the cursor is the last shard that was listed.
+        first_levels = sorted(entry.name for entry in os.scandir(self.root) if entry.is_dir() and len(entry.name) == 2)
+        for first in first_levels:
+            if cursor is not None and first < cursor[:2]:
+                continue
+            second_levels = sorted(entry.name for entry in os.scandir(self.root / first) if entry.is_dir())
+            for second in second_levels:
+                shard = f"{first}/{second}"
+                if cursor is not None and shard <= cursor:
+                    continue
+                if len(objects) >= limit:
+                    return objects, last_shard
+                for entry in os.scandir(self.root / shard):
+                    if entry.is_file() and not entry.name.startswith("."):
+                        modified_at = datetime.datetime.fromtimestamp(entry.stat().st_mtime, datetime.timezone.utc)
+                        objects.append((entry.name, modified_at))
+                last_shard = shard
+        return objects, None
+
+    async def list_page(self, cursor: Optional[str], limit: int) -> tuple[list[StoredObject], Optional[str]]:
+        return await anyio.to_thread.run_sync(self._list_page, cursor, limit)
+
+
+class S3Storage(StorageBackend):
+    """An S3-compatible bucket, e.g. AWS S3 or a local MinIO/moto server given as ``endpoint_url``."""
+
+    def __init__(self, bucket: str, endpoint_url: Optional[str] = None, region_name: Optional[str] = None,
+                 public_base_url: Optional[str] = None):
+        if get_session is None:
+            raise RuntimeError("The s3 storage backend requires aiobotocore to be installed")
+        self.bucket = bucket
+        self.endpoint_url = endpoint_url
+        self.region_name = region_name
+        self.public_base_url = public_base_url.rstrip("/") if public_base_url else None
+        self._exit_stack = contextlib.AsyncExitStack()
+        self._client = None
+
+    async def _get_client(self):
+        if self._client is None:
+            self._client = await self._exit_stack.enter_async_context(
+                get_session().create_client("s3", endpoint_url=self.endpoint_url, region_name=self.region_name)
+            )
+        return self._client
+
+    async def save(self, key: str, data: bytes):
+        client = await self._get_client()
+        await client.put_object(Bucket=self.bucket, Key=key, Body=data)
+
+    async def read(self, key: str) -> bytes:
+        client = await self._get_client()
+        response = await client.get_object(Bucket=self.bucket, Key=key)
+        async with response["Body"] as stream:
+            return await stream.read()
+
+    async def delete(self, key: str):
+        client = await self._get_client()
+        await client.delete_object(Bucket=self.bucket, Key=key)
+
+    def permanent_url(self, key: str) -> Optional[str]:
+        if self.public_base_url:
+            return f"{self.public_base_url}/{key}"
+        return None
+
+    async def url(self, key: str, expires_in: int = 3600) -> str:
+        if self.public_base_url:
+            return self.permanent_url(key)
+        client = await self._get_client()
+        return await client.generate_presigned_url(
+            "get_object", Params={"Bucket": self.bucket, "Key": key}, ExpiresIn=expires_in
+        )
+
+    async def list_page(self, cursor: Optional[str], limit: int) -> tuple[list[StoredObject], Optional[str]]:
+        client = await self._get_client()
+        params = {"Bucket": self.bucket, "MaxKeys": limit}
+        if cursor is not None:
+            params["StartAfter"] = cursor
+        response = await client.list_objects_v2(**params)
+        objects = [(item["Key"], item["LastModified"]) for item in response.get("Contents", [])]
+        next_cursor = objects[-1][0] if objects and response.get("IsTruncated") else None
+        return objects, next_cursor
+
+    async def close(self):
+        await self._exit_stack.aclose()
+        self._client = None
+
+
+def create_storage() -> StorageBackend:
+    if STORAGE_BACKEND == "s3":
+        if not S3_BUCKET:
+            raise RuntimeError("S3_BUCKET must be set when STORAGE_BACKEND is s3")
+        return S3Storage(S3_BUCKET, S3_ENDPOINT_URL, S3_REGION, S3_PUBLIC_BASE_URL)
+    return LocalStorage(IMAGE_DIR)
+
+
+storage = create_storage()
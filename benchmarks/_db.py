@@ -0,0 +1,21 @@
+import contextlib
+import tempfile
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.auth.database import Base
+
+
+@contextlib.asynccontextmanager
+async def temporary_database():
+    """Yield ``(session_maker, db_path)`` for a throwaway SQLite file with every table created."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = Path(tmp_dir) / "bench.db"
+        engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        try:
+            yield async_sessionmaker(engine, expire_on_commit=False), db_path
+        finally:
+            await engine.dispose()
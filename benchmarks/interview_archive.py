@@ -0,0 +1,101 @@
+"""Measure how much archiving shrinks the database, and interview read latency before and after it.
+
+Run with ``python -m benchmarks.interview_archive``.
+"""
+import asyncio
+import datetime
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import text
+
+from app.auth.database import User, Role
+from app.interview.archive import ArchiveStore
+from app.interview.crud import archive_finished_interviews, get_interview_detail
+from app.interview.model import Interview, InterviewTurn, InterviewStatus
+from app.question.model import QuestionType
+from benchmarks._db import temporary_database
+
+N_INTERVIEWS = 2000
+TURNS_PER_INTERVIEW = 10
+N_READS = 500
+
+WORDS = ("the candidate explained that a hash map gives constant time lookups while a balanced tree keeps "
+         "keys ordered and answers range queries in logarithmic time which matters for this workload").split()
+
+
+def transcript() -> str:
+    return " ".join(random.choice(WORDS) for _ in range(150))
+
+
+async def db_size(session_maker, db_path: Path) -> int:
+    async with session_maker() as db:
+        await db.execute(text("VACUUM"))
+    return db_path.stat().st_size
+
+
+def percentile(samples: list[float], q: float) -> float:
+    return statistics.quantiles(samples, n=100)[int(q * 100) - 1]
+
+
+async def main():
+    random.seed(0)
+    finished_at = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=60)
+
+    async with temporary_database() as (session_maker, db_path):
+        async with session_maker() as db:
+            candidate = User(fullName="Candidate", email="candidate@example.com", hashed_password="x",
+                             role=Role.candidate)
+            question_type = QuestionType(typeName="General")
+            db.add_all([candidate, question_type])
+            await db.flush()
+            for _ in range(N_INTERVIEWS):
+                db.add(Interview(candidate_id=candidate.id, type_id=question_type.id,
+                                 status=InterviewStatus.finished, score=random.uniform(0, 100),
+                                 finished_at=finished_at,
+                                 turns=[InterviewTurn(question_text=f"Question {turn}", transcript=transcript(),
+                                                      score=random.uniform(0, 100))
+                                        for turn in range(TURNS_PER_INTERVIEW)]))
+            await db.commit()
+
+        ids = list(range(1, N_INTERVIEWS + 1))
+        hot_latencies = []
+        for interview_id in random.sample(ids, N_READS):
+            async with session_maker() as db:
+                start = time.perf_counter()
+                await get_interview_detail(db, interview_id, candidate)
+                hot_latencies.append(time.perf_counter() - start)
+
+        size_before = await db_size(session_maker, db_path)
+
+        with tempfile.TemporaryDirectory() as archive_dir:
+            store = ArchiveStore(Path(archive_dir))
+            start = time.perf_counter()
+            async with session_maker() as db:
+                await archive_finished_interviews(db, store, 30, N_INTERVIEWS)
+            archive_seconds = time.perf_counter() - start
+
+            size_after = await db_size(session_maker, db_path)
+            archive_size = store.size_on_disk()
+
+            store.refresh()
+            cold_latencies = []
+            for interview_id in random.sample(ids, N_READS):
+                async with session_maker() as db:
+                    start = time.perf_counter()
+                    # Loads the header row, then the transcript from the archive, like the API does.
+                    assert "turns" in await get_interview_detail(db, interview_id, candidate, store)
+                    cold_latencies.append(time.perf_counter() - start)
+
+    print(f"{N_INTERVIEWS} interviews x {TURNS_PER_INTERVIEW} turns, archived in {archive_seconds:.2f} s")
+    print(f"database : {size_before / 2**20:7.2f} MiB -> {size_after / 2**20:7.2f} MiB (after VACUUM)")
+    print(f"archive  : {archive_size / 2**20:7.2f} MiB")
+    for name, samples in (("hot read     ", hot_latencies), ("archived read", cold_latencies)):
+        print(f"{name}: p50 {percentile(samples, 0.5) * 1e6:8.1f} us | p99 {percentile(samples, 0.99) * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,63 @@
+"""Compare the per-item question endpoints with their batch counterparts.
+
+Run with ``python -m benchmarks.question_batch``.
+"""
+import asyncio
+import time
+
+from sqlalchemy.future import select
+
+from app.question.crud import get_question_by_id, get_questions_by_ids, update_question, apply_question_batch
+from app.question.model import Question, QuestionType
+from app.question.schema import QuestionUpdate, QuestionBatchOperation
+from benchmarks._db import temporary_database
+
+N_QUESTIONS = 200
+
+
+async def main():
+    async with temporary_database() as (session_maker, _):
+        async with session_maker() as db:
+            question_type = QuestionType(typeName="General")
+            db.add(question_type)
+            await db.flush()
+            db.add_all([Question(text=f"Question {i}", answer=f"Answer {i}", type_id=question_type.id)
+                        for i in range(N_QUESTIONS)])
+            await db.commit()
+            ids = list((await db.execute(select(Question.id))).scalars().all())
+
+        # Every per-item request checks out its own session, as get_async_session does.
+        start = time.perf_counter()
+        for question_id in ids:
+            async with session_maker() as db:
+                await get_question_by_id(db, question_id)
+        per_item_read = time.perf_counter() - start
+
+        start = time.perf_counter()
+        async with session_maker() as db:
+            await get_questions_by_ids(db, ids)
+        batch_read = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for question_id in ids:
+            async with session_maker() as db:
+                await update_question(db, question_id, QuestionUpdate(answer="per-item", type_id=question_type.id))
+        per_item_write = time.perf_counter() - start
+
+        operations = [QuestionBatchOperation(op="update", id=question_id,
+                                             question=QuestionUpdate(answer="batch", type_id=question_type.id))
+                      for question_id in ids]
+        start = time.perf_counter()
+        async with session_maker() as db:
+            await apply_question_batch(db, operations)
+        batch_write = time.perf_counter() - start
+
+    print(f"{N_QUESTIONS} questions")
+    print(f"read : per-item {per_item_read * 1000:8.1f} ms | batch {batch_read * 1000:8.1f} ms "
+          f"| x{per_item_read / batch_read:.1f}")
+    print(f"write: per-item {per_item_write * 1000:8.1f} ms | batch {batch_write * 1000:8.1f} ms "
+          f"| x{per_item_write / batch_write:.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
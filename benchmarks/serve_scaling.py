@@ -0,0 +1,81 @@
+"""Throughput of ``serve.py`` with 1 to N workers.
+
+Run from the repository root with ``python -m benchmarks.serve_scaling [max_workers]``.
+"""
+import http.client
+import multiprocessing
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+HOST = "127.0.0.1"
+PORT = 8765
+PATH = "/"
+DURATION_SECONDS = 10
+CLIENTS_PER_WORKER = 4
+
+
+def wait_until_ready(timeout: float = 60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            connection = http.client.HTTPConnection(HOST, PORT, timeout=1)
+            connection.request("GET", PATH)
+            if connection.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("server did not start")
+
+
+def client(deadline: float, results: multiprocessing.Queue):
+    connection = http.client.HTTPConnection(HOST, PORT)
+    completed = 0
+    while time.time() < deadline:
+        connection.request("GET", PATH)
+        response = connection.getresponse()
+        response.read()
+        completed += 1
+    results.put(completed)
+
+
+def measure(workers: int) -> float:
+    server = subprocess.Popen(
+        [sys.executable, "serve.py", "--workers", str(workers), "--port", str(PORT), "--log-level", "warning"],
+        cwd=ROOT,
+    )
+    try:
+        wait_until_ready()
+        # Let every worker finish starting before measuring.
+        time.sleep(2)
+        results = multiprocessing.Queue()
+        deadline = time.time() + DURATION_SECONDS
+        clients = [multiprocessing.Process(target=client, args=(deadline, results))
+                   for _ in range(workers * CLIENTS_PER_WORKER)]
+        for process in clients:
+            process.start()
+        total = sum(results.get() for _ in clients)
+        for process in clients:
+            process.join()
+        return total / DURATION_SECONDS
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait()
+
+
+def main():
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else max(1, (os.cpu_count() or 2) // 2)
+    baseline = None
+    print(f"GET {PATH}, {CLIENTS_PER_WORKER} keep-alive clients per worker, {DURATION_SECONDS} s each")
+    for workers in range(1, max_workers + 1):
+        throughput = measure(workers)
+        baseline = baseline or throughput
+        print(f"{workers:2d} workers: {throughput:9.0f} req/s  x{throughput / baseline:.2f}")
+
+
+if __name__ == "__main__":
+    main()
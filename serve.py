@@ -0,0 +1,274 @@
+"""Multi-process server for NomzodAI.
+
+    python serve.py --workers 4 --port 8000
+
+The supervisor binds the listening socket and forks the workers. Each worker shares the socket and
+imports the application only after the fork, so every worker creates its own database engine and
+in-process caches. The supervisor never imports ``app``.
+
+Workers receive each other's invalidation messages through the supervisor (see
+``app/utils/invalidation.py``). SIGHUP replaces the workers one at a time; each old worker is stopped
+once its replacement is serving. SIGTERM and SIGINT stop all workers gracefully.
+"""
+import argparse
+import asyncio
+import os
+import selectors
+import signal
+import socket
+import sys
+import time
+import traceback
+
+import uvicorn
+
+APP = "app.main:app"
+# Sent by a worker's invalidation bus once its application has started; must match app/utils/invalidation.py.
+READY_ENTITY = b'"e":"__ready__"'
+MAX_MESSAGE_SIZE = 64 * 1024
+RESPAWN_DELAY_SECONDS = 1.0
+READY_TIMEOUT_SECONDS = 60.0
+
+
+class Worker:
+    def __init__(self, index: int, pid: int, bus: socket.socket):
+        self.index = index
+        self.pid = pid
+        self.bus = bus
+        self.ready = False
+        self.started_at = time.monotonic()
+
+
+class Supervisor:
+    def __init__(self, host: str, port: int, workers: int, log_level: str, graceful_timeout: int):
+        self.host = host
+        self.port = port
+        self.worker_count = workers
+        self.log_level = log_level
+        self.graceful_timeout = graceful_timeout
+        self.listener: socket.socket = None
+        self.selector = selectors.DefaultSelector()
+        self.workers: dict[int, Worker] = {}
+        self.retired: set[int] = set()
+        # Workers that exited on their own, including old workers that die while being replaced.
+        self.exited: set[int] = set()
+        self.reload_requested = False
+        self.stop_requested = False
+
+    def _listen(self):
+        family = socket.AF_INET6 if ":" in self.host else socket.AF_INET
+        self.listener = socket.socket(family, socket.SOCK_STREAM)
+        self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listener.bind((self.host, self.port))
+        self.listener.listen(2048)
+        self.listener.set_inheritable(True)
+
+    def _in_child(self, target, *args):
+        """Run ``target`` in a forked child with the supervisor's state released, and never return."""
+        code = 0
+        try:
+            for signum in (signal.SIGHUP, signal.SIGTERM, signal.SIGINT, signal.SIGCHLD):
+                signal.signal(signum, signal.SIG_DFL)
+            self.selector.close()
+            for worker in self.workers.values():
+                worker.bus.close()
+            target(*args)
+        except BaseException:
+            traceback.print_exc()
+            code = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(code)
+
+    def _prepare(self):
+        """Create the tables once, in a throwaway child, so the workers do not race on it at startup."""
+        pid = os.fork()
+        if pid == 0:
+            self._in_child(prepare_database)
+        _, status = os.waitpid(pid, 0)
+        if os.waitstatus_to_exitcode(status) != 0:
+            raise SystemExit("Database preparation failed")
+
+    def spawn(self, index: int) -> Worker:
+        supervisor_end, worker_end = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+        pid = os.fork()
+        if pid == 0:
+            supervisor_end.close()
+            os.environ["WORKER_INDEX"] = str(index)
+            self._in_child(run_worker, self.listener, worker_end, self.log_level, self.graceful_timeout)
+
+        worker_end.close()
+        supervisor_end.setblocking(False)
+        worker = Worker(index, pid, supervisor_end)
+        self.selector.register(supervisor_end, selectors.EVENT_READ, worker)
+        return worker
+
+    def _retire(self, worker: Worker):
+        self.selector.unregister(worker.bus)
+        worker.bus.close()
+        self.retired.add(worker.pid)
+        try:
+            os.kill(worker.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+    def _relay(self, source: Worker):
+        while True:
+            try:
+                message = source.bus.recv(MAX_MESSAGE_SIZE)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                return
+            if not message:
+                return
+            if READY_ENTITY in message:
+                source.ready = True
+                continue
+            for worker in list(self.workers.values()):
+                if worker is source:
+                    continue
+                try:
+                    worker.bus.send(message)
+                except OSError:
+                    # A full or closed buffer: that worker falls back to its cache TTLs.
+                    pass
+
+    def _poll(self, timeout: float):
+        for key, _ in self.selector.select(timeout):
+            self._relay(key.data)
+        self._reap()
+
+    def _reap(self):
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            if pid in self.retired:
+                self.retired.discard(pid)
+                continue
+            self.exited.add(pid)
+            for index, worker in list(self.workers.items()):
+                if worker.pid == pid:
+                    print(f"Worker {index} (pid {pid}) exited with {os.waitstatus_to_exitcode(status)}.")
+                    self.selector.unregister(worker.bus)
+                    worker.bus.close()
+                    del self.workers[index]
+                    if self.stop_requested:
+                        continue
+                    if time.monotonic() - worker.started_at < RESPAWN_DELAY_SECONDS:
+                        time.sleep(RESPAWN_DELAY_SECONDS)
+                    self.workers[index] = self.spawn(index)
+
+    def reload(self):
+        """Replace the workers one at a time, stopping each old worker once its replacement is ready.
+
+        If a replacement is not ready within READY_TIMEOUT_SECONDS, it is stopped, the old worker is kept
+        and the rest of the reload is abandoned, so a bad deploy never takes down the healthy workers.
+        """
+        print("Reloading workers.")
+        for index in sorted(self.workers):
+            old = self.workers[index]
+            self.workers[index] = self.spawn(index)
+            deadline = time.monotonic() + READY_TIMEOUT_SECONDS
+            while time.monotonic() < deadline and not self.stop_requested:
+                # A replacement that crashed has been respawned by _reap; wait for whichever is current.
+                replacement = self.workers.get(index)
+                if replacement is not None and replacement.ready:
+                    break
+                self._poll(0.1)
+
+            replacement = self.workers.get(index)
+            if replacement is not None and replacement.ready:
+                self._retire(old)
+                continue
+
+            if replacement is not None:
+                self._retire(replacement)
+            if old.pid in self.exited:
+                self.selector.unregister(old.bus)
+                old.bus.close()
+                old = self.spawn(index)
+            self.workers[index] = old
+            if not self.stop_requested:
+                print(f"Worker {index} replacement did not become ready; keeping the old workers.")
+            return
+
+    def shutdown(self):
+        for worker in self.workers.values():
+            self._retire(worker)
+        deadline = time.monotonic() + self.graceful_timeout + 5
+        while self.retired and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(0.1)
+        for pid in self.retired:
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+    def run(self):
+        self._listen()
+        self._prepare()
+        for index in range(self.worker_count):
+            self.workers[index] = self.spawn(index)
+        print(f"Serving on {self.host}:{self.port} with {self.worker_count} workers.")
+
+        signal.signal(signal.SIGHUP, self._request_reload)
+        signal.signal(signal.SIGTERM, self._request_stop)
+        signal.signal(signal.SIGINT, self._request_stop)
+
+        while not self.stop_requested:
+            self._poll(0.5)
+            if self.reload_requested:
+                self.reload_requested = False
+                self.reload()
+        self.shutdown()
+
+    def _request_reload(self, signum, frame):
+        self.reload_requested = True
+
+    def _request_stop(self, signum, frame):
+        self.stop_requested = True
+
+
+def prepare_database():
+    from app.auth.database import async_session_maker, create_db_and_tables
+    from app.interview.ranking import ranking_service
+    import app.main  # noqa: F401  (registers every model on Base.metadata)
+
+    async def prepare():
+        await create_db_and_tables()
+        # Backfills candidate_score if needed, so the workers do not all try to.
+        async with async_session_maker() as db:
+            await ranking_service.load(db)
+
+    asyncio.run(prepare())
+
+
+def run_worker(listener: socket.socket, bus: socket.socket, log_level: str, graceful_timeout: int):
+    from app.utils.invalidation import invalidation_bus
+
+    invalidation_bus.attach(bus)
+    config = uvicorn.Config(APP, log_level=log_level, timeout_graceful_shutdown=graceful_timeout)
+    uvicorn.Server(config).run(sockets=[listener])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run NomzodAI with several worker processes.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--log-level", default="info")
+    parser.add_argument("--graceful-timeout", type=int, default=30)
+    args = parser.parse_args()
+
+    Supervisor(args.host, args.port, args.workers, args.log_level, args.graceful_timeout).run()
+
+
+if __name__ == "__main__":
+    main()